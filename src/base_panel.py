@@ -8,12 +8,21 @@ class BasePanel(object):
     displayed within a boxed region while the Tetris is being played.
     """
 
+    __slots__ = ('rect_coords', 'blit_position', 'display_surface', 'dirty')
+    """
+    The fixed set of attributes every panel holds. Declared so that subclasses which also use slots (such as the
+    playfield) have no attribute dictionary at all.
+    """
+
     outline_colour = constants.WHITE  # RGB white
     """The outline colour that each panel will be surrounded with when displayed on the screen"""
 
     bg_colour = constants.BLACK  # RGB black
     """The background colour that each panel will have when displayed on the screen"""
 
+    # Note: panels must only be created after the display mode is set, since their surfaces are converted
+    # to the pixel format of the screen.
+
     def __init__(self, top_left, size):
         """
         Initialise all the attributes required to make up any panel object.
@@ -30,9 +39,31 @@ class BasePanel(object):
         Stores its top-left x and y coordinates, and its width and height.
         """
 
-        self.display_surface = pygame.Surface(size)
+        self.blit_position = self.rect_coords.topleft
+        """
+        The top-left coordinates the panel surface is drawn at on the screen, as a plain tuple for quick access.
+        Must be set again whenever the rect coordinates are moved.
+        """
+
+        # Convert the surface to the same pixel format as the screen, so it does not need converting on every blit.
+        self.display_surface = pygame.Surface(size).convert()
         """The surface object used to represent the image of the panel displayed on the screen."""
 
+        # Draw an outline around the edge of the surface with its outline colour, with width (thickness) of 2.
+        pygame.draw.rect(self.display_surface, self.get_outline_colour(), self.display_surface.get_rect(), 2)
+
+        """
+        Restrict all further drawing on the surface to the area inside the outline. Since the outline can then never be
+        drawn over, it only needs to be drawn this once, rather than each time the panel is drawn onto the screen.
+        """
+        self.display_surface.set_clip(self.display_surface.get_rect().inflate(-4, -4))
+
+        self.dirty = True
+        """
+        Determines whether or not the contents of the panel have changed since its surface was last set up.
+        Cleared by update_display() once the surface has been set up again.
+        """
+
     @staticmethod
     def get_outline_colour():
         """
@@ -51,6 +82,25 @@ class BasePanel(object):
         """
         pass  # Due to being abstract, it will not be implemented.
 
+    def update_display(self):
+        """
+        Sets up the surface of the panel again, but only if its contents have changed since it was last set up.
+        Returns True if the surface was set up again. Returns False otherwise.
+
+        :return: Boolean value
+        """
+
+        # The surface is already up to date if nothing has changed.
+        if not self.dirty:
+            return False
+
+        # Otherwise set up the surface with the updated contents.
+        self.setup_display()
+
+        # The surface is now up to date.
+        self.dirty = False
+        return True
+
     def get_surface(self):
         """
         returns the display surface of the panel.
@@ -73,4 +123,5 @@ class BasePanel(object):
 
         :return: None
         """
-        self.display_surface.fill(BasePanel.bg_colour)
+        # Use the pre-mapped pixel value of the background colour (black), so it does not need converting each time.
+        self.display_surface.fill(constants.BLACK_PX)
@@ -4,16 +4,25 @@ class Block(object):
     """
     The class used to represent a single square unit of a tetromino piece, taking up one cell of the playfield
     """
-    def __init__(self, surface_colour, x, y):
+
+    __slots__ = ('colour', 'x_coord', 'y_coord', 'sprite', 'owner')
+    """
+    The fixed set of attributes each block holds. Since every locked block on the playfield is its own instance,
+    using slots avoids giving each one a separate attribute dictionary, keeping them small and quick to access.
+    """
+
+    def __init__(self, surface_colour, x, y, owner=None):
         """
         Initialise the class, setting its surface colour and initial coordinates, then adding it to the grid.
 
         :param surface_colour: The colour it should be displayed with on the grid.
         :param x: The x coordinate it should start at on the grid.
         :param y: The y coordinate it should start at on the grid.
+        :param owner: The tetromino the block is a square unit of.
         :type surface_colour: tuple
         :type x: int
         :type y: int
+        :type owner: tetromino.Tetromino
         """
 
         # Initialise the attributes
@@ -23,109 +32,29 @@ class Block(object):
         """Stores the column index that the block is stored at on the playfield"""
         self.y_coord = y
         """Stores the row index that the block is stored at on the playfield"""
-
-    def get_colour(self):
-        """
-        Get the colour that the block is displayed with.
-
-        :return: RGB colour format in within a tuple (r,g,b)
+        self.sprite = None
         """
-
-        return self.colour
-
-    def get_x_coord(self):
+        Stores the image the block is drawn with on the playfield, in its colour.
+        Set by the playfield when the block is first added to it, as the colour of the block never changes.
         """
-        Get the x coordinates the block is set at on the grid.
-
-        :return: int value for the x coordinate
+        self.owner = owner
         """
-
-        return self.x_coord
-
-    def get_y_coord(self):
+        Stores the tetromino that the block is currently a square unit of, so the playfield can tell whether a block it
+        finds belongs to the piece being moved with a single identity check. Cleared once the tetromino is reused.
         """
-        Get the y coordinate the block is set at on the grid.
 
-        :return: int value for the y coordinate
+    @staticmethod
+    def create_group(surface_colour, positions, owner=None):
         """
+        Creates a group of blocks of the same colour together in a single call, such as the square units of a
+        tetromino.
 
-        return self.y_coord
-
-    def set_coords(self, x, y):
-        """
-        Sets the row and column position of the block
-
-        :param x: the column position to set the block to
-        :param y: the row position to set the block to
-        :type x: int
-        :type y: int
-        :return: None
-        """
-        self.x_coord = x
-        self.y_coord = y
-
-    def set_x_coord(self, x):
-        """
-        Sets the column position of the block
-
-        :param x: the row position to set the block to
-        :type x: int
-        :return: None
-        """
-        self.x_coord = x
-
-    def set_y_coord(self, y):
-        """
-        Sets the row position of the block
-
-        :param y: the row position to set the block to
-        :type y: int
-        :return: None
-        """
-        self.y_coord = y
-
-    def translate(self, dx=0, dy=0):
-        """
-        Moves the block along the playfield, horizontally or vertically.
-
-        :param dx: The change in the x coordinate of the block (+ve = right, -ve = left)
-        :param dy: The change in the y coordinate of the block (+ve = down, -ve = up)
-        :type dx: int
-        :type dy: int
-
-        :return: None
-        """
-
-        # Change the x and y coordinates
-        self.x_coord += dx
-        self.y_coord += dy
-
-    def shift_left(self):
-        """
-        Moves the block horizontally on the playfield, one space to the left.
-
-        :return: None
-        """
-
-        # Simply call the translate method, passing -1 to dx to move the block one space to the left.
-        self.translate(dx=-1)
-
-    def shift_right(self):
-        """
-        Moves the block horizontally on the playfield, one space to the right.
-
-        :return: None
-        """
-
-        # Simply call the translate method, passing 1 to dx to move the block one space to the right.
-        self.translate(dx=1)
-
-    def shift_down(self):
-        """
-        Moves the block vertically on the playfield, one space downwards.
-
-        :return: None
+        :param surface_colour: The colour the blocks should be displayed with on the grid.
+        :param positions: The (x, y) coordinates each block should start at on the grid.
+        :param owner: The tetromino the blocks are square units of.
+        :type surface_colour: tuple
+        :type positions: list(tuple)
+        :type owner: tetromino.Tetromino
+        :return: A list of the new blocks, in the same order as the positions.
         """
-
-        # Simply call the translate method, passing 1 to dy to move the block one space downwards.
-        self.translate(dy=1)
+        return [Block(surface_colour, x, y, owner) for x, y in positions]
@@ -14,10 +14,46 @@ CYAN     = (   0, 255, 255)
 ORANGE   = ( 255, 128,   0)
 PURPLE   = ( 128,   0, 128)
 
+# Colours as pixel values in the format of the display screen, so filling a surface does not need to convert them.
+# They hold the RGB tuples above until init_colours() is called, which can be used in exactly the same way.
+BLACK_PX  = BLACK
+WHITE_PX  = WHITE
+
+RED_PX    = RED
+GREEN_PX  = GREEN
+BLUE_PX   = BLUE
+YELLOW_PX = YELLOW
+CYAN_PX   = CYAN
+ORANGE_PX = ORANGE
+PURPLE_PX = PURPLE
+
 # Screen dimensions
 SCREEN_WIDTH = 340
 SCREEN_HEIGHT = 470
 SCREEN_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
 
 # Frame rate
-FRAME_RATE = 60  # 60 Hz
\ No newline at end of file
+FRAME_RATE = 60  # 60 Hz
+
+
+def init_colours(display):
+    """
+    Maps each colour to a pixel value in the format of the display screen, setting the pixel value constants.
+    Must be called after the display mode has been set.
+
+    :param display: The top level display surface.
+    :type display: pygame.Surface
+    :return: None
+    """
+    global BLACK_PX, WHITE_PX, RED_PX, GREEN_PX, BLUE_PX, YELLOW_PX, CYAN_PX, ORANGE_PX, PURPLE_PX
+
+    BLACK_PX  = display.map_rgb(BLACK)
+    WHITE_PX  = display.map_rgb(WHITE)
+
+    RED_PX    = display.map_rgb(RED)
+    GREEN_PX  = display.map_rgb(GREEN)
+    BLUE_PX   = display.map_rgb(BLUE)
+    YELLOW_PX = display.map_rgb(YELLOW)
+    CYAN_PX   = display.map_rgb(CYAN)
+    ORANGE_PX = display.map_rgb(ORANGE)
+    PURPLE_PX = display.map_rgb(PURPLE)
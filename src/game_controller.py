@@ -17,6 +17,9 @@ class GameController(object):
     AUTOREPEAT_FRAMES = 15
     """The number of frames that the left/right key must be held for before applying DAS (Delayed Auto Shift)"""
 
+    PAUSED_WAIT_TIMEOUT = 100
+    """The longest time (in milliseconds) the main loop will sleep for while waiting for input while paused"""
+
     def __init__(self, width, height):
         """
         Initialise the controller component, as well as instantiate view and controller components and store references.
@@ -29,7 +32,25 @@ class GameController(object):
         """
 
         # Set up the top level display screen, specifying the screen dimensions it should have.
-        pygame.display.set_mode([width, height])
+        screen = pygame.display.set_mode([width, height])
+
+        # Now that the display exists, map the colour constants to its pixel format.
+        constants.init_colours(screen)
+
+        """
+        Only allow the input events the game actually responds to onto the event queue. Other events are then 
+        discarded by pygame, rather than being looped over and ignored every frame. Mouse motion is allowed so the 
+        pause button only checks whether it is hovered over when the mouse pointer actually moves.
+        """
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT,
+                                  pygame.KEYDOWN,
+                                  pygame.KEYUP,
+                                  pygame.MOUSEMOTION,
+                                  pygame.MOUSEBUTTONDOWN,
+                                  pygame.MOUSEBUTTONUP,
+                                  pygame.VIDEOEXPOSE
+                                  ])
 
         self.model = GameInterfaceModel()
         """Stores reference of the model component"""
@@ -40,17 +61,38 @@ class GameController(object):
         self.autorepeat_counter = 0
         """The frame counter used to determine when the left/right key has been held long enough to apply DAS"""
 
-        self.left_key_held = False
-        """Determines whether or not the left arrow key is being held or not."""
+        self.last_direction = 0
+        """
+        The direction of the arrow key pressed most recently: -1 for left, 1 for right, or 0 for neither.
+        Only this key can apply DAS, and only until it is released (or the game is paused).
+        """
 
-        self.right_key_held = False
-        """Determines whether or not the right arrow key is being held or not."""
+        self.shift_actions = (self.model.shift_tetromino_left, self.model.shift_tetromino_right)
+        """The model methods used to shift the active tetromino piece left and right, in that order, for DAS."""
 
         self.is_running = True
         """
         Records whether or not the game is playing, to determine whether the main loop should stop.
         """
 
+        self.keydown_actions = {pygame.K_LEFT: self.press_left,
+                                pygame.K_RIGHT: self.press_right,
+                                pygame.K_DOWN: self.model.activate_soft_drop,
+                                pygame.K_x: self.model.rotate_clockwise,
+                                pygame.K_z: self.model.rotate_anticlockwise,
+                                pygame.K_ESCAPE: self.model.switch_pause
+                                }
+        """
+        Maps each key used by the game to the method that should be called when it is pressed down.
+        This acts as a 'switch/case' so each key event only needs a single look-up.
+        """
+
+        self.keyup_actions = {pygame.K_LEFT: self.release_left,
+                              pygame.K_RIGHT: self.release_right,
+                              pygame.K_DOWN: self.model.deactivate_soft_drop
+                              }
+        """Maps each key used by the game to the method that should be called when it is released."""
+
     def main_loop(self):
         """
         The main game loop of the program, to get user input, invoke model behaviour, and update the appearance of
@@ -68,7 +110,7 @@ class GameController(object):
         while self.is_running:
             
             # Get the state of the game - either paused or un-paused
-            paused = self.model.check_paused()
+            paused = self.model.is_paused
             # Force the mouse to stay within the display window if the game is playing.
             pygame.event.set_grab(not paused)
 
@@ -83,12 +125,26 @@ class GameController(object):
             # carry out the processing for auto-shift movement.
             self.autorepeat()
 
-            # Update the model and view components.
+            # Update the model component.
             self.update_model()
+
+            # Update the view component (which only draws anything if the screen has changed since the last frame).
             self.update_view()
 
-            # Limit the frame rate, which causes a delay the loop for a very short period of time.
-            clock.tick(frame_rate)
+            # While the game is paused, nothing will change until the player does something.
+            if self.model.is_paused:
+                # Rather than waking up every frame, sleep until an input event arrives, or the timeout (in ms) passes.
+                # Only do so if no events are already waiting, so they are not taken out of order.
+                if not pygame.event.peek():
+                    event = pygame.event.wait(GameController.PAUSED_WAIT_TIMEOUT)
+
+                    # Put the event back on the queue, so it is processed on the next loop as usual.
+                    if event.type != pygame.NOEVENT:
+                        pygame.event.post(event)
+
+            else:
+                # Limit the frame rate, which causes a delay the loop for a very short period of time.
+                clock.tick(frame_rate)
 
     def update_model(self):
         """
@@ -115,37 +171,39 @@ class GameController(object):
         """
 
         # Check whether the game is in its paused state
-        if self.model.check_paused():
-            # Do not allow DAS to be processed.
-            self.left_key_held = False
-            self.right_key_held = False
-            # Ensure that the counter is set to 0.
+        if self.model.is_paused:
+            # Do not allow DAS to be processed - ensure that the counter is set to 0.
             self.autorepeat_counter = 0
+            self.last_direction = 0
             # Exit the method.
             return
 
-        # Increment the auto-repeat counter for every frame where the left or right key is held down.
-        if self.left_key_held or self.right_key_held:
-            self.autorepeat_counter += 1
+        # Get the current state of every key on the keyboard, to check whether the left or right keys are held down.
+        keys = pygame.key.get_pressed()
 
-        # Check if the auto-repeat counter has surpassed the number of frames required to activate DAS.
-        if self.autorepeat_counter > GameController.AUTOREPEAT_FRAMES:
+        # Only the arrow key pressed most recently can apply DAS (-1 for left, 1 for right, or 0 for neither).
+        direction = self.last_direction
 
-            # If holding the left key:
-            if self.left_key_held:
-                # Shift the tetromino piece one space to the left
-                self.model.shift_tetromino_left()
+        """
+        Make sure that key is actually still held down, in case its release was missed (such as when the window lost
+        focus). If not, DAS stops until an arrow key is pressed down again.
+        """
+        if direction and not keys[pygame.K_LEFT if direction < 0 else pygame.K_RIGHT]:
+            direction = 0
+            self.last_direction = 0
+            self.autorepeat_counter = 0
 
-                # Slightly push back the counter - to add a bit of delay between auto shifts.
-                self.autorepeat_counter -= 3
+        # Increment the auto-repeat counter for every frame where the left or right key is held down.
+        if direction:
+            self.autorepeat_counter += 1
 
-            # If holding the right key:
-            if self.right_key_held:
-                # Shift the tetromino piece one space to the right
-                self.model.shift_tetromino_right()
+        # Check if a key is held and the auto-repeat counter has surpassed the number of frames needed to activate DAS.
+        if direction and self.autorepeat_counter > GameController.AUTOREPEAT_FRAMES:
+            # Shift the tetromino piece one space in the direction held (index 0 for left, 1 for right).
+            self.shift_actions[direction > 0]()
 
-                # Slightly push back the counter - to add a bit of delay between auto shifts.
-                self.autorepeat_counter -= 3
+            # Slightly push back the counter - to add a bit of delay between auto shifts.
+            self.autorepeat_counter -= 3
 
     def evaluate_input(self):
         """
@@ -165,79 +223,84 @@ class GameController(object):
                 self.is_running = False
 
             # Check if any keys have been pressed down on this frame
-            if event.type == pygame.KEYDOWN:
-                # If the left arrow key was pressed down:
-                if event.key == pygame.K_LEFT:
-                    # left key is now being held down
-                    self.left_key_held = True
-                    # both keys should not be able to be held down simultaneously.
-                    self.right_key_held = False
-
-                    # shift the active tetromino piece one space to the left
-                    self.model.shift_tetromino_left()
-                    # ensure that the auto-repeat counter is reset
-                    self.autorepeat_counter = 0
-
-                # If the right arrow key was pressed down:
-                elif event.key == pygame.K_RIGHT:
-                    # right key is now being held down
-                    self.right_key_held = True
-                    # both keys should not be able to be held down simultaneously.
-                    self.left_key_held = False
-
-                    # shift the active tetromino piece one space to the left
-                    self.model.shift_tetromino_right()
-                    # ensure that the auto-repeat counter is reset
-                    self.autorepeat_counter = 0
-
-                # If the down arrow key was pressed down:
-                if event.key == pygame.K_DOWN:
-                    # make the tetromino fall faster.
-                    self.model.activate_soft_drop()
-
-                # If the X key was pressed down:
-                if event.key == pygame.K_x:
-                    # rotate the tetromino 90 degrees clockwise.
-                    self.model.rotate_clockwise()
-
-                # If the Z key was pressed down:
-                if event.key == pygame.K_z:
-                    # rotate the tetromino 90 degrees anticlockwise.
-                    self.model.rotate_anticlockwise()
-
-                # If the escape key was pressed down:
-                if event.key == pygame.K_ESCAPE:
-                    # switch the state of the game between 'playing' and 'paused'
-                        self.model.switch_pause()
+            elif event.type == pygame.KEYDOWN:
+                # Look up the action for the key that was pressed down (None if the key is not used by the game).
+                action = self.keydown_actions.get(event.key)
+                if action is not None:
+                    action()
 
             # check if any keys have been released on this frame
-            if event.type == pygame.KEYUP:
-
-                # If the left arrow key was released
-                if event.key == pygame.K_LEFT:
-                    # left key is no longer being held down
-                    self.left_key_held = False
-                    # ensure that the auto-repeat counter is reset
-                    self.autorepeat_counter = 0
-
-                # If the right arrow key was released
-                elif event.key == pygame.K_RIGHT:
-                    # right key is no longer being held down
-                    self.right_key_held = False
-                    # ensure that the auto-repeat counter is reset
-                    self.autorepeat_counter = 0
-
-                # If the down arrow key was released
-                if event.key == pygame.K_DOWN:
-                    # make the tetromino fall at normal speed
-                    self.model.deactivate_soft_drop()
+            elif event.type == pygame.KEYUP:
+                # Look up the action for the key that was released (None if the key is not used by the game).
+                action = self.keyup_actions.get(event.key)
+                if action is not None:
+                    action()
+
+            # check if the mouse pointer has been moved on this frame
+            elif event.type == pygame.MOUSEMOTION:
+                # Notify the model component of this event.
+                self.model.mouse_move(event.pos)
 
             # check if the left mouse key has been pressed down on this frame
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # Notify the model component of this event.
-                self.model.mouse_down()
+                self.model.mouse_down(event.pos)
 
             # check if the left mouse key has been released down on this frame
-            if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                 # Notify the model component of this event.
-                self.model.mouse_up()
+                self.model.mouse_up(event.pos)
+
+            # check if the contents of the window need to be redrawn (e.g. after being uncovered by another window)
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.model.dirty = True
+
+    def press_left(self):
+        """
+        Called when the left arrow key is pressed down.
+
+        :return: None
+        """
+        # the left key now takes priority for DAS
+        self.last_direction = -1
+        # shift the active tetromino piece one space to the left
+        self.model.shift_tetromino_left()
+        # ensure that the auto-repeat counter is reset
+        self.autorepeat_counter = 0
+
+    def press_right(self):
+        """
+        Called when the right arrow key is pressed down.
+
+        :return: None
+        """
+        # the right key now takes priority for DAS
+        self.last_direction = 1
+        # shift the active tetromino piece one space to the right
+        self.model.shift_tetromino_right()
+        # ensure that the auto-repeat counter is reset
+        self.autorepeat_counter = 0
+
+    def release_left(self):
+        """
+        Called when the left arrow key is released.
+
+        :return: None
+        """
+        # the left key can no longer apply DAS
+        if self.last_direction < 0:
+            self.last_direction = 0
+        # ensure that the auto-repeat counter is reset
+        self.autorepeat_counter = 0
+
+    def release_right(self):
+        """
+        Called when the right arrow key is released.
+
+        :return: None
+        """
+        # the right key can no longer apply DAS
+        if self.last_direction > 0:
+            self.last_direction = 0
+        # ensure that the auto-repeat counter is reset
+        self.autorepeat_counter = 0
@@ -1,4 +1,6 @@
 import math
+import random
+from collections import deque
 
 import constants
 from playfield import Playfield
@@ -22,8 +24,39 @@ class GameInterfaceModel(object):
     :type : GameInterfaceModel
     """
 
+    GRAVITY_TABLE = tuple(math.ceil(((0.8 - ((level-1)*0.007))**(level-1)) * constants.FRAME_RATE)
+                          for level in range(1, 31))
+    """
+    The gravity frame interval for each level from 1 to 30, indexed by level - 1.
+    Calculated once, so the formula does not need to be evaluated each time the gravity is needed.
+    """
+
+    def __new__(cls):
+        """
+        Returns the single instance of the class, only creating it if it does not exist yet.
+
+        :return: The single GameInterfaceModel instance used throughout the program.
+        """
+
+        # Create the instance the first time the class is instantiated.
+        if cls.instance is None:
+            return super().__new__(cls)
+
+        # Any later attempts to instantiate the class give back the existing instance.
+        return cls.instance
+
     def __init__(self):
 
+        # The single instance should only be set up once, so do nothing if it already has been.
+        if GameInterfaceModel.instance is self:
+            return
+
+        self.dirty = True
+        """
+        Determines whether or not the whole screen needs to be redrawn (such as when the game starts or is reset).
+        Changes to individual components are instead recorded by their own 'dirty' attributes.
+        """
+
         self.score_panel = ScorePanel()
         """A reference to the ScorePanel instance used in the program"""
 
@@ -36,12 +69,12 @@ class GameInterfaceModel(object):
         self.lines_panel = LinesPanel()
         """A reference to the LinesPanel instance used in the program"""
 
-        self.hud_components = list([self.score_panel,
-                                    self.level_panel,
-                                    self.next_panel,
-                                    self.lines_panel
-                                    ])
-        """A list of instances from each panel class that will be used by the program and displayed on the screen."""
+        self.hud_components = (self.score_panel,
+                               self.level_panel,
+                               self.next_panel,
+                               self.lines_panel
+                               )
+        """A tuple of instances from each panel class that will be used by the program and displayed on the screen."""
 
         # Pass this instance to the Playfield constructor
         self.grid = Playfield(self)
@@ -50,13 +83,36 @@ class GameInterfaceModel(object):
         self.pause_button = PauseButton()
         """A reference to the PauseButton instance that will be used by the program and displayed on the screen """
 
-        self.random_generator = Tetromino.random_generator(self.grid)
-        """ A generator object used to create sequences of each type of tetromino piece in a random order, returning 
-        one at a time"""
+        self.is_paused = self.pause_button.is_paused
+        """
+        A copy of the paused state of the pause button, so the input handlers can check it directly.
+        Updated whenever the pause button may have been switched.
+        """
+
+        self.bag = deque()
+        """
+        The tetromino class types remaining in the current random sequence of all 7 types, taken from the front one at
+        a time. Refilled with a newly shuffled sequence once empty.
+        """
+
+        self.bag_order = list(Tetromino.get_tetromino_set())
+        """
+        A list of all 7 tetromino class types, shuffled in place each time the bag is refilled, so that a new list does
+        not need to be created for every random sequence.
+        """
+
+        self.piece_pool = {}
+        """
+        Maps each tetromino class type to a list of its instances that are no longer in use (since they were locked),
+        so they can be reused for new pieces rather than creating new instances each time.
+        """
 
         # Store this GameInterfaceModel instance as the single instance used throughout the program.
         GameInterfaceModel.instance = self
 
+        # Build the tetromino images in the pixel format of the screen (which now exists) before any pieces are made.
+        Tetromino.build_images()
+
         # set the next tetromino piece of the NextPanel instance
         self.set_next_tetromino()
 
@@ -69,11 +125,8 @@ class GameInterfaceModel(object):
         :return: None
         """
 
-        # Update the status of the pause button.
-        self.pause_button.update_status()
-
-        # Nothing else should occur if the game is paused.
-        if self.pause_button.check_paused():
+        # Nothing should occur if the game is paused.
+        if self.is_paused:
             # Make sure the contents of the playfield and the next piece are hidden
             self.grid.set_visible(False)
             self.next_panel.set_visible(False)
@@ -86,6 +139,20 @@ class GameInterfaceModel(object):
         # Update the state of the playfield.
         self.grid.update()
 
+    def check_dirty(self):
+        """
+        Returns True if anything displayed on the screen has changed since it was last drawn. Returns False otherwise.
+
+        :return: Boolean value
+        """
+
+        # Check the flag for the whole screen first, then the flags of each individual component.
+        if self.dirty or self.grid.dirty or self.pause_button.dirty:
+            return True
+
+        # The screen has changed if any of the panels have changed.
+        return any(panel.dirty for panel in self.hud_components)
+
     def get_grid(self):
         """
         Returns the playfield component of the game.
@@ -96,9 +163,9 @@ class GameInterfaceModel(object):
 
     def get_hud_components(self):
         """
-        Returns a list of all the game information containers displayed on the screen.
+        Returns a tuple of all the game information containers displayed on the screen.
 
-        :return: A list of BasePanel derived classes
+        :return: A tuple of BasePanel derived classes
         """
         return self.hud_components
 
@@ -113,13 +180,44 @@ class GameInterfaceModel(object):
     # @staticmethod
     def generate_random_tetromino(self):
         """
-        Returns a random tetromino object (using the random_generator() generator object)
+        Returns a random tetromino object, taken from the current random sequence of tetromino types.
 
         :return: an instance of the Tetromino class
         """
 
-        # use next() to continue from  their last line where the generator was 'halted'.
-        return next(self.random_generator)
+        # Start a new random sequence once every tetromino type from the current one has been used.
+        if not self.bag:
+            self.refill_bag()
+
+        # Take the next class type from the front of the sequence.
+        tetromino_type = self.bag.popleft()
+
+        # Get the instances of that type that are no longer in use.
+        free_pieces = self.piece_pool.get(tetromino_type)
+
+        # Reuse one of them if there are any, resetting it back to its original state.
+        if free_pieces:
+            piece = free_pieces.pop()
+            piece.reset()
+            return piece
+
+        # Otherwise return a new instance of the type.
+        return tetromino_type(self.grid)
+
+    def refill_bag(self):
+        """
+        Adds a new sequence of all 7 tetromino class types, in a random order, to the bag.
+
+        :return: None
+        """
+
+        # Arrange the tetromino derived classes in a random order (the order left from the last sequence does not affect
+        # how random the new one is).
+        bag_order = self.bag_order
+        random.shuffle(bag_order)
+
+        # Add them to the end of the bag.
+        self.bag.extend(bag_order)
 
     def set_next_tetromino(self):
         """
@@ -144,9 +242,16 @@ class GameInterfaceModel(object):
         # get the next tetromino piece from the Next Queue
         next_tetromino = self.next_panel.get_next()
 
+        # Keep a reference to the previous active piece, which will no longer be in use.
+        previous_tetromino = self.grid.active_tetromino
+
         # set this tetromino as the new active piece on the playfield
         self.grid.set_tetromino(next_tetromino)
 
+        # Add the previous active piece to the pool, so it can be reused.
+        if previous_tetromino is not None:
+            self.piece_pool.setdefault(type(previous_tetromino), []).append(previous_tetromino)
+
         # set the next tetromino of the Next Queue
         self.set_next_tetromino()
 
@@ -158,7 +263,7 @@ class GameInterfaceModel(object):
         """
 
         # Nothing should occur if the game is paused.
-        if self.pause_button.check_paused():
+        if self.is_paused:
             return
 
         # Simply call the same named method of the held Playfield class instance
@@ -172,7 +277,7 @@ class GameInterfaceModel(object):
         """
 
         # Nothing should occur if the game is paused.
-        if self.pause_button.check_paused():
+        if self.is_paused:
             return
 
         # Simply call the same named method of the held Playfield class instance
@@ -187,7 +292,12 @@ class GameInterfaceModel(object):
 
         # Get the current level
         level = self.level_panel.get_current_level()
-        # Use formula to calculate the gravity
+
+        # Look up the gravity for the level if it is within the pre-calculated range.
+        if level <= len(GameInterfaceModel.GRAVITY_TABLE):
+            return GameInterfaceModel.GRAVITY_TABLE[level - 1]
+
+        # Otherwise use formula to calculate the gravity
         gravity = ((0.8 - ((level-1)*0.007))**(level-1)) * constants.FRAME_RATE
 
         # Must be an integer - so round it up to the nearest integer.
@@ -201,7 +311,7 @@ class GameInterfaceModel(object):
         """
 
         # Nothing should occur if the game is paused.
-        if self.pause_button.check_paused():
+        if self.is_paused:
             return
         
         self.grid.activate_soft_drop()
@@ -222,7 +332,7 @@ class GameInterfaceModel(object):
         """
 
         # Nothing should occur if the game is paused.
-        if self.pause_button.check_paused():
+        if self.is_paused:
             return
 
         # Wrapper method: simply call the method of the same name from the held Playfield instance
@@ -236,7 +346,7 @@ class GameInterfaceModel(object):
         """
 
         # Nothing should occur if the game is paused.
-        if self.pause_button.check_paused():
+        if self.is_paused:
             return
 
         # Wrapper method: simply call the method of the same name from the held Playfield instance
@@ -283,23 +393,44 @@ class GameInterfaceModel(object):
         # Simply call the method of the same name from the pause button.
         self.pause_button.switch_pause()
 
-    def mouse_down(self):
+        # Keep the copy of the paused state up to date.
+        self.is_paused = self.pause_button.is_paused
+
+    def mouse_move(self, pos):
+        """
+        Called when the mouse pointer is moved, to check if it is hovering over the pause button.
+
+        :param pos: The position the mouse pointer was moved to.
+        :type pos: tuple
+        :return: None
+        """
+        # Simply call the method of the same name from the pause button.
+        self.pause_button.mouse_move(pos)
+
+    def mouse_down(self, pos):
         """
         Called when the mouse is pressed down, to check if the pause button is being clicked down on.
 
+        :param pos: The position of the mouse pointer when it was pressed down.
+        :type pos: tuple
         :return: None
         """
         # Simply call the method of the same name from the pause button.
-        self.pause_button.mouse_down()
+        self.pause_button.mouse_down(pos)
 
-    def mouse_up(self):
+    def mouse_up(self, pos):
         """
         Called when the mouse is released, to check if the pause button has been clicked.
 
+        :param pos: The position of the mouse pointer when it was released.
+        :type pos: tuple
         :return: None
         """
         # Simply call the method of the same name from the pause button.
-        self.pause_button.mouse_up()
+        self.pause_button.mouse_up(pos)
+
+        # The button may have been clicked, so keep the copy of the paused state up to date.
+        self.is_paused = self.pause_button.is_paused
 
     def check_paused(self):
         """
@@ -308,8 +439,8 @@ class GameInterfaceModel(object):
         :return: Boolean value
         """
 
-        # Wrapper method: call the pause button's own check_paused() method.
-        return self.pause_button.check_paused()
+        # Return the copy of the pause button's state, which is kept up to date whenever it may switch.
+        return self.is_paused
 
     def game_over(self):
         """
@@ -330,22 +461,22 @@ class GameInterfaceModel(object):
         :return: None
         """
 
-        # Reset all attributes
-        self.score_panel = ScorePanel()
-        self.level_panel = LevelPanel()
-        self.next_panel = NextPanel()
-        self.lines_panel = LinesPanel()
+        # The whole screen will need redrawing.
+        self.dirty = True
 
-        self.hud_components = list([self.score_panel,
-                                    self.level_panel,
-                                    self.next_panel,
-                                    self.lines_panel
-                                    ])
+        # Reset each of the existing components in place, rather than creating new ones.
+        # (The level panel must be reset before the playfield, as the playfield's gravity depends on the level.)
+        self.score_panel.reset()
+        self.level_panel.reset()
+        self.next_panel.reset()
+        self.lines_panel.reset()
 
-        self.grid = Playfield(self)
-        self.pause_button = PauseButton()
+        self.grid.reset()
+        self.pause_button.reset()
+        self.is_paused = self.pause_button.is_paused
 
-        self.random_generator = Tetromino.random_generator(self.grid)
+        # Start a new random sequence of tetrominoes.
+        self.bag.clear()
 
         # set the next tetromino piece of the NextPanel instance
         self.set_next_tetromino()
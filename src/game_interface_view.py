@@ -32,108 +32,160 @@ class GameInterfaceView(object):
     def redraw(self):
         """
         Update the display of the screen to match the updated models.
+        Nothing is drawn if nothing displayed on the screen has changed since it was last drawn
+        (such as while the game is paused).
         :return: None
         """
 
-        # Clear the screen first.
-        self.clear_screen()
+        # Skip all drawing if none of the components have changed.
+        if not self.model.check_dirty():
+            return
 
-        # Draw all the panel components holding game information.
-        self.draw_hud()
+        # Get a reference to the top level surface where everything is drawn onto, once for the whole redraw.
+        screen = pygame.display.get_surface()
+
+        # The list of rectangular areas of the screen that have been drawn onto during this redraw.
+        updated_rects = []
+
+        # Determines whether or not the whole screen is being redrawn.
+        full_redraw = self.model.dirty
+
+        # If the whole screen needs redrawing, every component must be drawn again over a cleared screen.
+        if full_redraw:
+            # Clear the screen first.
+            self.clear_screen(screen)
+
+            # The screen as a whole is now up to date.
+            self.model.dirty = False
 
-        # Draw the playfield onto the screen.
-        self.draw_grid()
+        # Draw all the panel components holding game information that have changed (or all of them if redrawing all).
+        self.draw_hud(screen, updated_rects, full_redraw)
 
-        # Draw the pause button onto the screen
-        self.draw_pause_button()
+        # Draw the playfield onto the screen if it has changed.
+        self.draw_grid(screen, updated_rects, full_redraw)
 
-        # Must refresh the display screen to show all changes made to it.
-        pygame.display.flip()
+        # Draw the pause button onto the screen if it has changed.
+        self.draw_pause_button(screen, updated_rects, full_redraw)
 
-    def clear_screen(self):
+        # After a full redraw, the entire display screen is refreshed in one go (no argument updates the whole screen).
+        if full_redraw:
+            pygame.display.update()
+
+        # Otherwise refresh only the areas of the display screen that were drawn onto.
+        else:
+            pygame.display.update(updated_rects)
+
+    def clear_screen(self, screen):
         """
         Clears all the contents of the screen to allow for redrawing.
+        :param screen: The top level display surface.
+        :type screen: pygame.Surface
         :return: None
         """
 
-        # Get the top-level display screen.
-        screen = pygame.display.get_surface()
-        # Fill it with the RGB colour given by the background colour attribute.
-        screen.fill(self.bg_colour)
+        # Fill the screen with the background colour (red), using its pixel value pre-mapped to the screen format.
+        screen.fill(constants.RED_PX)
 
-    def draw_hud(self):
+    def draw_hud(self, screen, updated_rects, full_redraw):
         """
-        draw all the panel components with their updated data onto the screen.
+        draw all the panel components whose data has changed onto the screen.
 
+        :param screen: The top level display surface, where everything is drawn onto.
+        :param updated_rects: The list to add the rectangular coordinates of each redrawn panel to.
+        :param full_redraw: Whether or not the whole screen is being redrawn, so it must be drawn even if unchanged.
+        :type screen: pygame.Surface
+        :type updated_rects: list(pygame.Rect)
+        :type full_redraw: bool
         :return: None
         """
 
-        # Get a reference to a list of all the panel components from the model component of the program.
+        # Get a reference to a tuple of all the panel components from the model component of the program.
         panel_list = self.model.get_hud_components()
 
-        # Get a reference to the top level surface where everything is drawn onto.
-        screen = pygame.display.get_surface()
+        # The list of (surface, rect) pairs of the panels to draw, so they can all be drawn in a single call.
+        blit_sequence = []
 
         # Iterate over each panel object in the list.
         for panel in panel_list:
-            # First update the visual display of the panel so it is ready to be redrawn onto the screen.
-            panel.setup_display()
-            # Get the updated display surface and the rectangular coordinates of the panel object.
-            surface = panel.get_surface()
-            rect = panel.get_rect()
+            # First update the visual display of the panel if it has changed, so it is ready to be redrawn.
+            # Panels that have not changed since they were last drawn are left as they are (unless redrawing all).
+            if not panel.update_display() and not full_redraw:
+                continue
 
-            # Get a reference to the outline colour of the panel object.
-            outline_colour = panel.get_outline_colour()
-            # Draw the surface of the panel onto the screen, at its rect position.
-            screen.blit(surface, rect)
-            # Draw an outline around the panel surface with its outline colour, with width (thickness) of 2.
-            pygame.draw.rect(screen, outline_colour, rect, 2)
+            # Get the updated display surface and the rectangular coordinates of the panel object, directly.
+            surface = panel.display_surface
+            rect = panel.rect_coords
 
-    def draw_grid(self):
+            # Add the surface of the panel to be drawn at its position (its outline is already part of it).
+            blit_sequence.append((surface, panel.blit_position))
+
+            # Record the area of the screen that was drawn onto.
+            updated_rects.append(rect)
+
+        # Draw the surfaces of all the changed panels onto the screen together.
+        screen.blits(blit_sequence, doreturn=False)
+
+    def draw_grid(self, screen, updated_rects, full_redraw):
         """
-        draw the updated grid component onto the screen.
+        draw the updated grid component onto the screen, if it has changed.
 
+        :param screen: The top level display surface, where everything is drawn onto.
+        :param updated_rects: The list to add the rectangular coordinates of the grid to, if it is redrawn.
+        :param full_redraw: Whether or not the whole screen is being redrawn, so it must be drawn even if unchanged.
+        :type screen: pygame.Surface
+        :type updated_rects: list(pygame.Rect)
+        :type full_redraw: bool
         :return: None
         """
 
         # Get a reference to the playfield from the model component of the program.
         grid = self.model.get_grid()
 
-        # Get a reference to the top level surface where everything is drawn onto.
-        screen = pygame.display.get_surface()
-
-        # Update the visual display of the grid, ready to be redrawn onto the screen.
-        grid.setup_display()
+        # Update the visual display of the grid if it has changed, ready to be redrawn onto the screen.
+        # Nothing needs to be drawn if the playfield has not changed since it was last drawn (unless redrawing all).
+        if not grid.update_display() and not full_redraw:
+            return
 
-        # Get the updated display surface and the rectangular coordinates of the grid.
-        surface = grid.get_surface()
-        rect = grid.get_rect()
+        # Get the updated display surface and the rectangular coordinates of the grid, directly.
+        surface = grid.display_surface
+        rect = grid.rect_coords
 
-        # Draw the surface of the grid onto the screen, at its rect position.
-        screen.blit(surface, rect)
+        # Draw the surface of the grid onto the screen, at its position (its outline is already part of it).
+        screen.blit(surface, grid.blit_position)
 
-        # Get a reference to the outline colour of the grid.
-        outline_colour = grid.get_outline_colour()
+        # Record the area of the screen that was drawn onto.
+        updated_rects.append(rect)
 
-        # Draw an outline around the playfield surface with its outline colour, with width (thickness) of 2.
-        pygame.draw.rect(screen, outline_colour, rect, 2)
-
-    def draw_pause_button(self):
+    def draw_pause_button(self, screen, updated_rects, full_redraw):
         """
-        draw the pause button component onto the screen.
+        draw the pause button component onto the screen, if its image has changed.
 
+        :param screen: The top level display surface, where everything is drawn onto.
+        :param updated_rects: The list to add the rectangular coordinates of the button to, if it is redrawn.
+        :param full_redraw: Whether or not the whole screen is being redrawn, so it must be drawn even if unchanged.
+        :type screen: pygame.Surface
+        :type updated_rects: list(pygame.Rect)
+        :type full_redraw: bool
         :return: None
         """
 
         # Get a reference to the pause button from the model component of the program.
         pause_button = self.model.get_pause_button()
 
-        # Get a reference to the top level surface where everything is drawn onto.
-        screen = pygame.display.get_surface()
+        # Nothing needs to be drawn if the image of the button has not changed since it was last drawn.
+        if not pause_button.dirty and not full_redraw:
+            return
 
-        # Get the image and the rectangular coordinates of the pause button.
-        image = pause_button.get_image()
+        # Get the area of the atlas holding the current image, and the rectangular coordinates of the pause button.
+        area = pause_button.get_atlas_area()
         rect = pause_button.get_rect()
 
-        # Draw the surface of the pause button onto the screen, at its rect position.
-        screen.blit(image, rect)
+        # Clear the area behind the button with the background colour first, as its image may be partly transparent.
+        screen.fill(constants.RED_PX, rect)
+
+        # Draw the current image of the pause button from the atlas onto the screen, at its rect position.
+        screen.blit(pause_button.atlas, rect, area)
+
+        # Record the area of the screen that was drawn onto, and that the button is now up to date.
+        updated_rects.append(rect)
+        pause_button.dirty = False
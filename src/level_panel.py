@@ -18,6 +18,8 @@ class LevelPanel(InfoPanel):
         # Alter the rect coordinates.
         self.rect_coords.right = 320  # x-coordinate of the right side of the panel is set.
         self.rect_coords.top = 280  # y-coordinate of the top of the panel is set.
+        # Record the new position the surface will be drawn at.
+        self.blit_position = self.rect_coords.topleft
 
         self.level = 1
         """
@@ -28,6 +30,25 @@ class LevelPanel(InfoPanel):
         self.level_label = "LEVEL"
         """ Used to hold the string that will be used for the label text of the container displaying the level."""
 
+        # The label never changes, so its surface image only needs to be created once.
+        self.label_text = InfoPanel.create_text(self.level_label)
+        """The surface image of the label text, drawn onto the panel each time it is set up."""
+
+        # Get the rectangular coordinates of the label text surface to modify them.
+        self.label_rect = self.label_text.get_rect()
+        """The local rectangular coordinates the label text is drawn at on the panel."""
+
+        # local y-coordinate of the top of the label text surface is set.
+        self.label_rect.top = 5
+        # local x position of the left side of the label text surface is set.
+        self.label_rect.left = 10
+
+        self.level_text = None
+        """
+        The surface image of the current level value, kept until the level changes.
+        None when it needs to be created again.
+        """
+
         self.lines_to_level = 10
         """The number of lines needed to clear per level to increase the level"""
 
@@ -42,17 +63,22 @@ class LevelPanel(InfoPanel):
         :return:
         """
 
-        # Repeat as many times as the number of lines that were cleared
-        for i in range(lines):
-            # Decrement the number of lines needed to level up
-            self.lines_left -= 1
+        # The total number of lines cleared since the last level up, including the lines just cleared.
+        lines_cleared = self.lines_to_level - self.lines_left + lines
+
+        # Each full set of lines_to_level lines cleared results in a level up.
+        levels_gained = lines_cleared // self.lines_to_level
 
-            # Check if enough lines have been cleared to level up
-            if self.lines_left == 0:
-                # Increase the level
-                self.level += 1
-                # Reset the lines needed for the next level
-                self.lines_left = self.lines_to_level
+        # The lines left over count towards the next level.
+        self.lines_left = self.lines_to_level - lines_cleared % self.lines_to_level
+
+        # Check if enough lines have been cleared to level up
+        if levels_gained > 0:
+            # Increase the level
+            self.level += levels_gained
+            # The level displayed has changed, so its text image must be created again.
+            self.level_text = None
+            self.dirty = True
 
     def get_current_level(self):
         """
@@ -72,26 +98,34 @@ class LevelPanel(InfoPanel):
         # Clear the surface before redrawing.
         self.clear_surface()
 
-        # Create surface images of the label text and level text.
-        label_text = InfoPanel.create_text(self.level_label)
-        level_text = InfoPanel.create_text(str(self.level).zfill(2))  # At least 2 digits are always shown
+        # Create a surface image of the level text, only if the level has changed since it was last created.
+        # (the label text image is created once in the constructor).
+        if self.level_text is None:
+            self.level_text = InfoPanel.create_text(f"{self.level:02d}")  # At least 2 digits are always shown
 
-        # Get the rectangular coordinates of the text surfaces to modify them.
-        label_rect = label_text.get_rect()
-        level_rect = level_text.get_rect()
+        # Get the rectangular coordinates of the text surface to modify them.
+        level_rect = self.level_text.get_rect()
 
         """Since the text is drawn on the panel, its rect coordinates are relative to the panel
         rather than the screen"""
-        # local y-coordinate of the top of the label text surface is set.
-        label_rect.top = 5
-        # local x position of the left side of the label text surface is set.
-        label_rect.left = 10
-
         # local y-coordinate of the bottom of the level text surface is set.
         level_rect.bottom = self.rect_coords.height - 5
         # local x position of the left side of the level text surface is set.
         level_rect.left = 10
 
         # Draw both texts onto the display surface at the position given by their corresponding rectangular coordinates.
-        self.display_surface.blit(label_text, label_rect)
-        self.display_surface.blit(level_text, level_rect)
+        self.display_surface.blit(self.label_text, self.label_rect)
+        self.display_surface.blit(self.level_text, level_rect)
+
+    def reset(self):
+        """
+        Resets the level back to its original state, to allow for the game to be played again.
+
+        :return: None
+        """
+        self.level = 1
+        self.lines_left = self.lines_to_level
+
+        # The level displayed has changed, so its text image must be created again.
+        self.level_text = None
+        self.dirty = True
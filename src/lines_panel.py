@@ -7,6 +7,12 @@ class LinesPanel(InfoPanel):
     cleared (full rows of blocks) by the player during the Tetris game.
     """
 
+    LINES_STRINGS = tuple(str(lines).zfill(3) for lines in range(1000))
+    """
+    The display strings for every lines value from 0 to 999, each with at least 3 digits.
+    Built once so that the value does not need to be formatted again each time it is drawn.
+    """
+
     def __init__(self):
 
         # temporary variables for the dimensions of the display surface of the panel.
@@ -18,6 +24,8 @@ class LinesPanel(InfoPanel):
         # Alter the rect coordinates accordingly.
         self.rect_coords.left = 10
         self.rect_coords.top = 10
+        # Record the new position the surface will be drawn at.
+        self.blit_position = self.rect_coords.topleft
 
         self.lines = 0
         """Stores the number of full rows of blocks cleared by the player"""
@@ -25,6 +33,12 @@ class LinesPanel(InfoPanel):
         self.lines_label = "LINES CLEARED"
         """ Used to hold the string that will be used as the label text for the lines value displayed in the panel"""
 
+        self.display_prefix = self.lines_label + " - -    "
+        """The part of the displayed text that comes before the lines value, which never changes."""
+
+        self.text_centery = self.rect_coords.height // 2
+        """The local y position of the centre of the text, which is half the height of the surface."""
+
     def add_lines_cleared(self, lines_cleared):
         """
         increases the total number of lines cleared by a given amount.
@@ -35,6 +49,9 @@ class LinesPanel(InfoPanel):
         """
         self.lines += lines_cleared
 
+        # The value displayed has changed.
+        self.dirty = True
+
     def setup_display(self):
         """
         Setup the surface of the lines panel, with an updated lines value, before it is drawn onto the game interface.
@@ -45,11 +62,17 @@ class LinesPanel(InfoPanel):
         # Clear the surface before redrawing.
         self.clear_surface()
 
+        # Look up the lines value as a string with at least 3 digits, only formatting it if beyond the pre-built range.
+        if self.lines < len(LinesPanel.LINES_STRINGS):
+            lines_string = LinesPanel.LINES_STRINGS[self.lines]
+        else:
+            lines_string = str(self.lines).zfill(3)
+
         """
         Arrange the string of text that will be displayed on the screen. It is the combination of the label string and
-        the value of the number of lines cleared. At least 3 digits are always shown for the lines value.
+        the value of the number of lines cleared.
         """
-        display_string = self.lines_label + " - -    " + str(self.lines).zfill(3)
+        display_string = self.display_prefix + lines_string
 
         # Create surface images of the single string consisting of the label text and lines text
         display_text = InfoPanel.create_text(display_string)
@@ -64,9 +87,20 @@ class LinesPanel(InfoPanel):
         local y position of the centre of the label text is set to half the height of the surface so it is positioned
         at the centre of the surface.
         """
-        text_rect.centery = self.rect_coords.height // 2
+        text_rect.centery = self.text_centery
         # local x position of the left side of the level text surface is set.
         text_rect.left = 10
 
         # Draw the text surface onto the display surface at the position given by its rectangular coordinates.
         self.display_surface.blit(display_text, text_rect)
+
+    def reset(self):
+        """
+        Resets the number of lines cleared back to 0, to allow for the game to be played again.
+
+        :return: None
+        """
+        self.lines = 0
+
+        # The value displayed has changed.
+        self.dirty = True
@@ -1,4 +1,9 @@
 import os
+
+# Centre the position of the program window, so  displayed at the centre of the computer screen.
+# This must be set before the display module is initialised.
+os.environ['SDL_VIDEO_CENTERED'] = '1'
+
 import pygame
 import constants
 from game_controller import GameController
@@ -7,17 +12,29 @@ from game_controller import GameController
 This module is used as the entry point of the program.
 """
 
-# Initialise all pygame modules
-pygame.init()
 
-# Centre the position of the program window, so  displayed at the centre of the computer screen.
-os.environ['SDL_VIDEO_CENTERED'] = '1'
+def main():
+    """
+    Runs the game, initialising only the pygame modules it needs (the display and the font modules),
+    rather than every module such as the audio mixer, which the game does not use.
+
+    :return: None
+    """
+
+    # Initialise the pygame modules used by the game.
+    pygame.display.init()
+    pygame.font.init()
+
+    """
+    Instantiate a GameController object, passing the screen size constants as arguments.
+    Immediately run the main loop after it is initialised.
+    """
+    GameController(constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT).main_loop()
+
+    # After the main loop ends, exit the program by termination all pygame modules
+    pygame.quit()
 
-"""
-Instantiate a GameController object, passing the screen size constants as arguments.
-Immediately run the main loop after it is initialised.
-"""
-GameController(constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT).main_loop()
 
-# After the main loop ends, exit the program by termination all pygame modules
-pygame.quit()
+# Only run the game when this module is run directly, rather than being imported.
+if __name__ == '__main__':
+    main()
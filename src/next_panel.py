@@ -18,10 +18,25 @@ class NextPanel(InfoPanel):
         # Alter the rect coordinates.
         self.rect_coords.right = 320  # x-coordinate of the right side of the panel is set.
         self.rect_coords.top = 170  # y-coordinate of the top of the panel is set.
+        # Record the new position the surface will be drawn at.
+        self.blit_position = self.rect_coords.topleft
 
         self.next_label = "NEXT PIECE"
         """ Used to hold the string that will be used for the label text for the container displayed."""
 
+        # The label never changes, so its surface image only needs to be created once.
+        self.label_text = InfoPanel.create_text(self.next_label)
+        """The surface image of the label text, drawn onto the panel each time it is set up."""
+
+        # Get the rectangular coordinates of the label text surface to modify them.
+        self.label_rect = self.label_text.get_rect()
+        """The local rectangular coordinates the label text is drawn at on the panel."""
+
+        # local y-coordinate of the top of the text surface is set.
+        self.label_rect.top = 5
+        # Set the local center-x position of the text surface to the middle of the panel surface
+        self.label_rect.centerx = self.rect_coords.width // 2
+
         self.next_tetromino = None
         """The next tetromino piece that will be placed on the playfield after the current one."""
 
@@ -38,21 +53,8 @@ class NextPanel(InfoPanel):
         # Clear the surface before redrawing.
         self.clear_surface()
 
-        # Create a surface image of the label text.
-        label_text = InfoPanel.create_text(self.next_label)
-
-        # Get the rectangular coordinates of the text surface to modify them.
-        label_rect = label_text.get_rect()
-
-        """Since the text is drawn on the panel, its rect coordinates are relative to the panel
-        rather than the screen"""
-        # local y-coordinate of the top of the text surface is set.
-        label_rect.top = 5
-        # Set the local center-x position of the text surface to the middle of the panel surface
-        label_rect.centerx = self.rect_coords.width // 2
-
-        # Draw the label text onto the display surface at the position given by its rectangular coordinates.
-        self.display_surface.blit(label_text, label_rect)
+        # Draw the pre-made label text onto the display surface at the position given by its rectangular coordinates.
+        self.display_surface.blit(self.label_text, self.label_rect)
 
         # Stop at this point if the next piece should not be displayed.
         if not self.show_next_piece:
@@ -83,6 +85,9 @@ class NextPanel(InfoPanel):
         """
         self.next_tetromino = next_piece
 
+        # The piece displayed has changed.
+        self.dirty = True
+
     def get_next(self):
         """
         Returns the next tetromino piece.
@@ -99,5 +104,21 @@ class NextPanel(InfoPanel):
         :type is_visible: bool
         :return: None
         """
+        # The panel only needs redrawing if the visibility is actually changing.
+        if self.show_next_piece != is_visible:
+            self.dirty = True
+
         # Simply set the parameter to the attribute used for this purpose.
         self.show_next_piece = is_visible
+
+    def reset(self):
+        """
+        Resets the Next Queue back to its original state, to allow for the game to be played again.
+
+        :return: None
+        """
+        self.next_tetromino = None
+        self.show_next_piece = True
+
+        # The contents displayed have changed.
+        self.dirty = True
@@ -6,6 +6,43 @@ class PauseButton(object):
     The class used to represent the pause button of the game, to allow the player to temporarily stop gameplay.
     """
 
+    __slots__ = ('is_hovered', 'clicked_down', 'is_paused', 'dirty', 'current_area')
+    """
+    The fixed set of attributes each button holds (the images and position are shared by the class, so are left out).
+    Using slots avoids giving the button an attribute dictionary, making its attributes quicker to access.
+    """
+
+    IMAGE_SIZE = (80, 80)
+    """The size each image of the button should have so that they can fit on the game interface."""
+
+    # The images are the same for every button, so they are shared by the class, and set by load_images().
+    atlas = None
+    """
+    A single surface holding all four images of the button, laid out in a 2x2 grid, so the button is always drawn
+    from the same surface. Not hovered on the left, hovered on the right, playing at the top, paused at the bottom.
+    """
+    atlas_areas = None
+    """
+    The rectangular area of each image within the atlas, ordered so that they can be looked up by the index
+    (is_hovered * 2 + is_paused):
+    0 - not hovered, playing.
+    1 - not hovered, paused.
+    2 - hovered, playing.
+    3 - hovered, paused.
+    """
+
+    # The button is always displayed at the same position, so its coordinates are also shared by the class.
+    rect_coords = None
+    """
+    The rectangular coordinates of the pause button image being displayed on the screen.
+    Stores its top-left x and y coordinates, and its width and height.
+    """
+    bounds = None
+    """
+    The left, top, right and bottom edges of the button image on the screen.
+    Used to check whether the mouse pointer is over the button without going through the Rect object.
+    """
+
     def __init__(self):
 
         # Define the Boolean attributes of the class.
@@ -21,80 +58,101 @@ class PauseButton(object):
         """
         Determines whether or not the game is in its ‘paused’ state.
         """
-
-        dir1 = "pause-button1.png"
-        dir2 = "pause-button2.png"
-        dir3 = "resume-button1.png"
-        dir4 = "resume-button2.png"
-
-        # Load all the images to be used for the button, and set them to the 'image' attributes
-        self.pause_image = pygame.image.load(dir1)
-        """
-        The regular image of the pause button that will be displayed when the game is playing,
-        and the mouse pointer is on it.
-        """
-        self.alt_pause_image = pygame.image.load(dir2)
+        self.dirty = True
         """
-        The 'glowing' image of the pause button that will be displayed when the game is playing 
-        while the mouse pointer is on the it.
+        Determines whether or not the image of the button has changed since it was last drawn onto the screen.
+        Cleared by the view component after the button is redrawn.
         """
-        self.resume_image = pygame.image.load(dir3)
+
+        # Make sure the images and position of the button have been set up (only happens the first time a button
+        # is created).
+        PauseButton.load_images()
+
+        self.current_area = None
         """
-        The image of the pause button that will be displayed when the game is playing,
-        and the mouse pointer is on it.
+        The area of the atlas holding the image that the button should currently be displayed with.
+        Only looked up again when the hover or paused state changes, rather than every time the button is drawn.
         """
-        self.alt_resume_image = pygame.image.load(dir4)
+
+        # Set the current image from the starting state.
+        self.image_changed()
+
+        # Check whether the mouse pointer starts on the button, as it may not be moved before the first frame.
+        self.mouse_move(pygame.mouse.get_pos())
+
+    @classmethod
+    def load_images(cls):
         """
-        The 'glowing' image of the pause button that will be displayed when the game is paused, 
-        while the mouse pointer is on the it.
+        Loads all the images to be used for the button and packs them into the atlas of the class, along with setting
+        the position of the button. They are only set up the first time this is called, as they are shared by every
+        button. Only the atlas is kept, so the separate images are released once they have been packed into it.
+
+        :return: None
         """
 
-        # Temporarily store the size each image should have so that they can fit on the game interface.
-        image_size = (80, 80)
+        # The images have already been loaded.
+        if cls.atlas is not None:
+            return
 
-        # Reduce the size of the images to the size defined above.
-        self.pause_image = pygame.transform.smoothscale(self.pause_image, image_size)
-        self.alt_pause_image = pygame.transform.smoothscale(self.alt_pause_image, image_size)
-        self.resume_image = pygame.transform.smoothscale(self.resume_image, image_size)
-        self.alt_resume_image = pygame.transform.smoothscale(self.alt_resume_image, image_size)
+        # Load all the images for the button (each saved at the size defined by the class).
+        # The 'glowing' images are kept as images of their own, rather than made by adding one glow overlay to the
+        # regular images, as the glow differs between the pause and resume images.
+        # They are ordered by the state of the button, the same as the atlas areas.
+        images = (cls.load_image("pause-button1.png"),
+                  cls.load_image("resume-button1.png"),
+                  cls.load_image("pause-button2.png"),
+                  cls.load_image("resume-button2.png"))
 
-        self.rect_coords = self.pause_image.get_rect()
+        # Pack the images into the atlas, placing each one by the (hovered, paused) bits of its index.
+        width, height = cls.IMAGE_SIZE
+        cls.atlas = pygame.Surface((width * 2, height * 2), pygame.SRCALPHA).convert_alpha()
+        cls.atlas_areas = tuple(pygame.Rect((index >> 1) * width, (index & 1) * height, width, height)
+                                for index in range(4))
+        for image, area in zip(images, cls.atlas_areas):
+            cls.atlas.blit(image, area)
+
+        # Set the rect coordinates to the size of the images, centred where the button will be displayed.
+        cls.rect_coords = pygame.Rect((0, 0), cls.IMAGE_SIZE)
+        cls.rect_coords.center = (270, 400)
+        cls.bounds = (cls.rect_coords.left, cls.rect_coords.top, cls.rect_coords.right, cls.rect_coords.bottom)
+
+    @staticmethod
+    def load_image(file_dir):
         """
-        The rectangular coordinates of the pause button image being displayed on the screen.
-        Stores its top-left x and y coordinates, and its width and height.
+        Returns the image from the given file, converted to the pixel format of the screen (keeping its transparency)
+        so it does not need converting each time it is drawn.
+        The image files are already saved at the size of the button, so they do not need scaling when loaded.
+
+        :param file_dir: The file name of the image to load.
+        :type file_dir: str
+        :return: A pygame Surface object of the image.
         """
+        return pygame.image.load(file_dir).convert_alpha()
 
-        # Change the position of the rect coordinates. Set the centre position of where the image will be displayed.
-        self.rect_coords.center = (270, 400)
+    def get_atlas_area(self):
+        """
+        Returns the area of the atlas holding the image of the pause button that it should be displayed with.
 
-    def get_image(self):
+        :return: A pygame Rect object
         """
-        Returns the surface image of the pause button that it should be displayed with.
 
-        :return: A pygame Surface object
+        # Simply return the area set when the state of the button last changed.
+        return self.current_area
+
+    def image_changed(self):
         """
+        Called whenever the hover or paused state of the button changes, to update the image it is displayed with,
+        and mark that it needs to be redrawn.
 
-        # For when the mouse pointer 'hovers' over the pause button:
-        if self.is_hovered:
-            # For when the game is paused:
-            if self.is_paused:
-                # The 'glowing' resume image should be returned.
-                return self.alt_resume_image
-            # For when the game is NOT paused:
-            else:
-                # The 'glowing' pause image should be returned.
-                return self.alt_pause_image
+        :return: None
+        """
 
-        # For when the mouse pointer is NOT 'hovering' over the pause button:
-        else:
-            # For when the game is paused:
-            if self.is_paused:
-                # The 'regular' resume image should be returned.
-                return self.resume_image
-            # For when the game is NOT paused:
-            else:
-                # The 'glowing' pause image should be returned.
-                return self.pause_image
+        # Look up the area of the image in the atlas, indexed by whether the button is hovered over (the higher bit),
+        # and whether the game is paused (the lower bit).
+        self.current_area = self.atlas_areas[(self.is_hovered << 1) | self.is_paused]
+
+        # The button should now be displayed with a different image.
+        self.dirty = True
 
     def get_rect(self):
         """
@@ -123,6 +181,9 @@ class PauseButton(object):
         # Simply flip the pause value
         self.is_paused = not self.is_paused
 
+        # The button should now be displayed with a different image.
+        self.image_changed()
+
     def on_click(self):
         """
         Called whenever the button is clicked on.
@@ -133,52 +194,87 @@ class PauseButton(object):
         # 'Switch' the pause value.
         self.switch_pause()
 
-    def mouse_down(self):
+    def contains_point(self, pos):
+        """
+        Returns True if the given position on the screen lies on the button image. Returns False otherwise.
+
+        :param pos: The x and y coordinates of the position to check.
+        :type pos: tuple
+        :return: Boolean value
+        """
+        x, y = pos
+        left, top, right, bottom = self.bounds
+
+        # Include the left and top edges, but not the right and bottom edges, the same as Rect.collidepoint.
+        return left <= x < right and top <= y < bottom
+
+    def mouse_down(self, pos):
         """
         Called when the left mouse button is clicked down.
 
+        :param pos: The position of the mouse pointer when the button was clicked down, taken from the event.
+        :type pos: tuple
         :return: None
         """
-        # Check if the button is being hovered over by the mouse pointer.
-        if self.is_hovered:
+        # Check if the mouse pointer was on the button when it was clicked down.
+        if self.contains_point(pos):
             # If so, then the button is being clicked down.
             self.clicked_down = True
 
-    def mouse_up(self):
+    def mouse_up(self, pos):
         """
         Called when the left mouse button is released.
 
+        :param pos: The position of the mouse pointer when the button was released, taken from the event.
+        :type pos: tuple
         :return: None
         """
 
         """
-        The button will be considered ‘clicked’ if the mouse is currently hovering over it 
-        AND it is being clicked down.
+        The button will be considered ‘clicked’ if the mouse pointer is on it when released
+        AND it was being clicked down.
         """
-        if self.is_hovered and self.clicked_down:
+        if self.clicked_down and self.contains_point(pos):
             # Handle the processing that occurs after being clicked.
             self.on_click()
-            # It was clicked, therefore no longer clicked down.
-            self.clicked_down = False
 
-    def update_status(self):
+        # The mouse button was released, therefore the button is no longer clicked down.
+        self.clicked_down = False
+
+    def mouse_move(self, pos):
         """
-        To be called once per frame, to check whether or not the image is hovered over,
-        or is clicked down.
+        Called when the mouse pointer is moved, to check whether or not the image is hovered over.
 
+        :param pos: The position the mouse pointer was moved to, taken from the event.
+        :type pos: tuple
         :return: None
         """
 
-        # Get the current position of the mouse pointer
-        mouse_pos = pygame.mouse.get_pos()
-
-        # Check whether or not the mouse is located within the rectangular bounds of the pause button image
-        if self.rect_coords.collidepoint(mouse_pos):
-            # If so, then the button is currently being 'hovered' over
-            self.is_hovered = True
+        # Check whether or not the mouse pointer is on the button. If so, then it is currently being 'hovered' over.
+        is_hovered = self.contains_point(pos)
 
-        else:
-            # Otherwise, the button is not 'hovered' over.
-            self.is_hovered = False
-            # The 'clicked down' flag should be reset, as the mouse pointer left the button.
+        # The 'clicked down' flag should be reset if the mouse pointer is not on the button.
+        if not is_hovered:
             self.clicked_down = False
+
+        # The hover state (and the image displayed) only changes if the mouse pointer entered or left the button.
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            self.image_changed()
+
+    def reset(self):
+        """
+        Resets the state of the button back to its original state, to allow for the game to be played again.
+        The images are kept, so they do not need to be loaded again.
+
+        :return: None
+        """
+        self.is_hovered = False
+        self.clicked_down = False
+        self.is_paused = True
+
+        # The image displayed may have changed.
+        self.image_changed()
+
+        # Check the hover state again, as the mouse pointer may already be on the button.
+        self.mouse_move(pygame.mouse.get_pos())
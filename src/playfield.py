@@ -10,13 +10,40 @@ class Playfield(BasePanel):
     played on.
     """
 
+    __slots__ = ('grid_width', 'grid_height', 'hidden_rows', 'column_pixels', 'row_pixels', 'cell_positions',
+                 'gridline_colour', 'gridline_overlay', 'active_tetromino', 'matrix', 'row_masks', 'full_row_mask',
+                 'model', 'gravity', 'lock_delay', 'entry_delay', 'gravity_counter', 'lock_counter', 'frame_count',
+                 'in_lock_phase', 'tetromino_isactive', 'in_clear_phase', 'clear_delay', 'game_over', 'end_generator',
+                 'clear_generator', 'soft_drop_isactive', 'grid_visible', 'state', 'phase_table',
+                 'entry_frame', 'resume_frame', 'empty_row')
+    """
+    The fixed set of attributes the playfield holds (in addition to those of BasePanel). Since many of them are used
+    every frame, using slots makes them quicker to access than looking them up in an attribute dictionary.
+    """
+
     square_size = 20
     """ The square length in pixels for each grid cell when it is displayed on the screen.
     Will often be used to define the x and y intervals to draw on the playfield surface."""
 
+    # The states the playfield can be in, each with its own phase to go through every frame.
+    SPAWN_STATE = 0
+    """The state for when there is no active tetromino, so the next one should be spawned."""
+    ACTIVE_STATE = 1
+    """The state for when there is an active tetromino, being dropped and locked onto the playfield."""
+    CLEAR_STATE = 2
+    """The state for when lines are being cleared."""
+    GAME_OVER_STATE = 3
+    """The state for when a game over condition has been met, so the game over animation is being played."""
+
     SOFT_DROP_GRAVITY = 1
     """The frame interval for gravity for when the active tetromino piece is allowed to drop at a faster rate."""
 
+    block_sprites = {}
+    """
+    Cache of the square surface images used to draw blocks on the playfield, mapped by their display colour.
+    Each image is only created the first time a block of its colour is drawn, then reused for every block after that.
+    """
+
     def __init__(self, model_instance):
         """
         Initialises the Playfield instance
@@ -53,15 +80,56 @@ class Playfield(BasePanel):
         # Call the constructor of the BasePanel class, to setup the generic panel attributes.
         super().__init__((top_left_x, top_left_y), (surface_width, surface_height))
 
+        # Work out the pixel coordinates of every column and row of the grid on the surface, as they never change.
+        self.column_pixels = tuple(column * self.square_size for column in range(self.grid_width))
+        """The x pixel coordinate on the playfield surface of the left of each column of the grid."""
+        self.row_pixels = tuple((row - self.hidden_rows) * self.square_size for row in range(self.grid_height))
+        """
+        The y pixel coordinate on the playfield surface of the top of each row of the grid.
+        (The hidden rows are given negative coordinates, as they are above the surface.)
+        """
+        self.cell_positions = tuple((x_coord, y_coord) for y_coord in self.row_pixels for x_coord in self.column_pixels)
+        """
+        The top-left pixel coordinates on the playfield surface of every cell of the grid, in the same order as the
+        matrix, so the position a block is drawn at can be looked up rather than made each time it is drawn.
+        """
+
         self.gridline_colour = constants.WHITE  # RGB White
         """The gridline colour that the playfield will have with when displayed on the screen"""
 
+        # The gridlines never change, so draw them once onto a transparent surface, rather than every time.
+        self.gridline_overlay = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA).convert_alpha()
+        """
+        A transparent surface with the gridlines of the playfield drawn on it,
+        to be drawn over the blocks whenever the playfield surface is set up.
+        """
+        self.draw_gridlines(self.gridline_overlay)
+
         self.active_tetromino = None
         """The tetromino piece currently being controlled (by the player) on the playfield"""
 
-        # Initialise the grid data structure as an empty list of lists.
-        self.matrix = [[None] * self.grid_width for _ in range(self.grid_height)]
-        """The data structure for storing the square units of the tetromino pieces currently on the playfield"""
+        # Initialise the grid data structure as an empty flat list, with a cell for every column of every row.
+        self.matrix = [None] * (self.grid_width * self.grid_height)
+        """
+        The data structure for storing the square units of the tetromino pieces currently on the playfield.
+        The rows are stored one after another in a single list, so the cell at column x and row y is found at the
+        index (y * grid_width + x).
+        """
+
+        self.row_masks = [0] * self.grid_height
+        """
+        The cells occupied by blocks on each row of the playfield, stored as a single integer per row, where bit x is
+        set if there is a block at column x. Kept up to date whenever a block is added or removed, so that checking
+        whether a row is full or empty does not require looking through its cells.
+        """
+        self.full_row_mask = (1 << self.grid_width) - 1
+        """The value of a row mask when every cell of the row has a block (a set bit for every column)."""
+
+        self.empty_row = (None,) * self.grid_width
+        """
+        The cells of a row with no blocks, copied into the matrix whenever a row is emptied, rather than building a new
+        row of empty cells each time. A tuple, so it can never be changed by mistake.
+        """
 
         self.model = model_instance
         """A reference of the single GameInterfaceModel instance used throughout the program"""
@@ -79,8 +147,19 @@ class Playfield(BasePanel):
         """The frame counter used to determine when the gravity frame interval has been passed"""
         self.lock_counter = 0
         """The frame counter used to determine when the lock delay frame interval has been passed"""
-        self.entry_counter = 0
-        """The frame counter used to determine when the entry delay frame interval has been passed"""
+        self.frame_count = 0
+        """The number of frames the playfield has been updated for, used to schedule when the entry delay ends."""
+        self.entry_frame = 0
+        """
+        The frame (compared with the frame count) on which the next tetromino should spawn, once the entry delay has
+        passed. Set once when the playfield enters the spawn state, rather than counting each frame of the delay.
+        """
+        self.resume_frame = 0
+        """
+        The frame (compared with the frame count) on which the line clear or game over generator should next be resumed.
+        Lets the generators wait out a delay with a single yield of the number of frames to wait, rather than yielding
+        once for every frame of the delay.
+        """
 
         self.in_lock_phase = False
         """Determines whether or not the active tetromino should be going through the lock phase"""
@@ -107,6 +186,14 @@ class Playfield(BasePanel):
         self.grid_visible = True
         """Determines whether or not the contents on the grid should be displayed"""
 
+        self.state = Playfield.SPAWN_STATE
+        """
+        The current state of the playfield, worked out from the flags above by update_state() whenever they change,
+        so that the phase to go through each frame can be looked up directly.
+        """
+        self.phase_table = (self.spawn_phase, self.active_phase, self.clear_phase, self.game_over_phase)
+        """The phase method to call every frame for each state of the playfield, indexed by the state."""
+
     @staticmethod
     def get_square_size():
         """
@@ -116,6 +203,31 @@ class Playfield(BasePanel):
         """
         return Playfield.square_size
 
+    @staticmethod
+    def get_block_sprite(colour):
+        """
+        Returns the square surface image used to draw a block of the given colour on the playfield,
+        creating it the first time it is needed.
+
+        :param colour: The RGB colour that the block is displayed with.
+        :type colour: tuple
+        :return: pygame.Surface
+        """
+
+        # Look up the image in the cache.
+        sprite = Playfield.block_sprites.get(colour)
+
+        # Create the image if it has not been made yet.
+        if sprite is None:
+            # A square surface, in the same pixel format as the screen, completely filled with the colour.
+            sprite = pygame.Surface((Playfield.square_size, Playfield.square_size)).convert()
+            sprite.fill(colour)
+
+            # Store it so it can be reused for every other block of the same colour.
+            Playfield.block_sprites[colour] = sprite
+
+        return sprite
+
     def setup_display(self):
         """
         Setup the playfield surface before it is drawn onto the game interface.
@@ -133,8 +245,8 @@ class Playfield(BasePanel):
         # Draw the blocks on the playfield.
         self.draw_blocks()
 
-        # Draw the gridlines of the playfield.
-        self.draw_gridlines()
+        # Draw the gridlines of the playfield, from the surface they were drawn onto beforehand.
+        self.display_surface.blit(self.gridline_overlay, (0, 0))
 
     def draw_blocks(self):
         """
@@ -144,77 +256,71 @@ class Playfield(BasePanel):
         :return: None
         """
 
+        # The images of the blocks paired with the positions they should be drawn at, to be drawn all at once.
+        blit_sequence = []
+
+        # Local references to the grid width and the pixel coordinates of each cell, used for every row.
+        width = self.grid_width
+        cell_positions = self.cell_positions
+
         # Loop through each visible row of the playfield - the hidden rows will be skipped
         for row in range(self.hidden_rows, self.grid_height):
 
-            # The actual y pixel coordinate of where the top left of the block will be drawn from.
-            y_coord = (row - self.hidden_rows) * self.square_size
+            # Get the cells of the row once, rather than looking each one up from the whole matrix.
+            start = row * width
+            row_blocks = self.matrix[start:start + width]
 
             # Loop through each column of the playfield
-            for column in range(0, self.grid_width):
+            for column in range(0, width):
 
-                # The actual x pixel coordinate of where the top left of the block will be drawn from.
-                x_coord = column * self.square_size
+                # Get the block at the current position
+                block = row_blocks[column]
 
-                # Check if the position to get a block from is empty
-                if self.check_cell_empty(column, row):
+                # Check if the position is empty
+                if block is None:
                     # No block to display, so move on to the block at next column
                     continue
 
-                # Get the block at the current position
-                block = self.matrix[row][column]
-
-                # Define the area where the block will be drawn at on the surface.
-                area_rect = pygame.Rect((x_coord, y_coord), (self.square_size, self.square_size))
-
-                # Get the colour that the block will be displayed with.
-                colour = block.get_colour()
+                # Add the image of the block (given to it when it was added to the playfield), along with the pixel
+                # coordinates of its cell (where the top left of the block is drawn from), to be drawn on the surface.
+                blit_sequence.append((block.sprite, cell_positions[start + column]))
 
-                # Draw the block on the surface by filling the area position its display colour
-                self.display_surface.fill(colour, area_rect)
+        # Draw every block on the surface in a single call.
+        self.display_surface.blits(blit_sequence, doreturn=False)
 
-    def draw_gridlines(self):
+    def draw_gridlines(self, surface):
         """
-        Sub-method of setup_display().
-        Used to draw the horizontal and vertical gridlines of the playfield.
+        Used to draw the horizontal and vertical gridlines of the playfield onto the given surface.
+        Only called once, to draw them onto the gridline overlay.
 
+        :param surface: The surface to draw the gridlines onto, with the same size as the playfield surface.
+        :type surface: pygame.Surface
         :return: None
         """
 
-        # Variables used for the lower-bounds of the nested for loop iteration for each row and column of the grid.
-        x1 = 1
-        y1 = 1
-
         # Get the width and height of the surface.
         width = self.rect_coords.width
         height = self.rect_coords.height
 
-        # Variables used for the upper-bounds of the nested for loop iteration for each row and column of the grid.
-        # Using floor division just to ensure that x2 and y2 are integers, otherwise an error would be raised.
-        x2 = width // self.square_size  # Should end up as 10   - number of columns
-        y2 = height // self.square_size  # Should end up as 20 - number of visible rows
-
         """
-        Draw all the horizontal gridlines.
-        Loop through the all the rows of the playfield not including the boundaries (0 and 19)
-        (Python's range method is exclusive)
+        The gridlines form a pattern that repeats for every cell, so draw a single tile the size of one cell with
+        its top and left edges filled (each a strip 1 pixel wide, in the gridline colour), then tile it across the
+        whole surface in one call.
         """
-        for y in range(y1, y2):
-            # The actual y pixel coordinate where each horizontal gridline is drawn from
-            y_coord = y * self.square_size
-            # Draw a horizontal gridline with the gridline colour, and width of 1.
-            pygame.draw.line(self.display_surface, self.gridline_colour, [0, y_coord], [width, y_coord], 1)
+        tile = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA).convert_alpha()
+        tile.fill(self.gridline_colour, (0, 0, self.square_size, 1))
+        tile.fill(self.gridline_colour, (0, 0, 1, self.square_size))
+
+        # Place a tile at the top left of each cell on the surface.
+        tile_sequence = [(tile, (x_coord, y_coord))
+                         for y_coord in range(0, height, self.square_size)
+                         for x_coord in range(0, width, self.square_size)]
 
         """
-        Draw all the vertical gridlines.
-        Loop through the all the columns of the playfield not including the boundaries (0 and 9)
-        (Python's range method is exclusive)
+        This also draws gridlines on the top and left boundaries of the surface, but they are never displayed,
+        as the playfield surface is clipped to within its outline.
         """
-        for x in range(x1, x2):
-            # The actual x pixel coordinate where each vertical gridline is drawn from
-            x_coord = x * self.square_size
-            # Draw a veritcal gridline with the gridline colour, and width of 1
-            pygame.draw.line(self.display_surface, self.gridline_colour, [x_coord, 0], [x_coord, height], 1)
+        surface.blits(tile_sequence, doreturn=False)
 
     def update(self):
         """
@@ -223,22 +329,84 @@ class Playfield(BasePanel):
         :return: None
         """
 
+        # Count the frame.
+        self.frame_count += 1
+
+        # Go through the phase for the current state of the playfield.
+        self.phase_table[self.state]()
+
+    def update_state(self):
+        """
+        Works out the current state of the playfield from its flags. Must be called whenever any of them change.
+
+        :return: None
+        """
+
         # Continue the game over animation if a game over condition has been met
         if self.game_over:
-            next(self.end_generator)
+            self.state = Playfield.GAME_OVER_STATE
 
         # Continue to clear lines if in the line clear phase
         elif self.in_clear_phase:
-            next(self.clear_generator)
+            self.state = Playfield.CLEAR_STATE
 
         # Go through the drop phase and lock phase if there is a tetromino active
         elif self.tetromino_isactive:
-            self.drop_phase()
-            self.lock_phase()
+            self.state = Playfield.ACTIVE_STATE
 
         else:
             # Go through the spawn phase if there is no tetromino active - to generate the next active tetromino
-            self.spawn_phase()
+            if self.state != Playfield.SPAWN_STATE:
+                """
+                Schedule the frame the next tetromino should spawn on. The spawn phase will first be gone through on
+                the next frame counted, then the entry delay must pass, with the tetromino spawning on the frame after.
+                """
+                self.entry_frame = self.frame_count + self.entry_delay + 2
+
+            self.state = Playfield.SPAWN_STATE
+
+    def active_phase(self):
+        """
+        Sub-method of update(). Goes through the drop phase and lock phase of the active tetromino.
+
+        :return: None
+        """
+        self.drop_phase()
+        self.lock_phase()
+
+    def clear_phase(self):
+        """
+        Sub-method of update(). Continues to clear lines.
+
+        :return: None
+        """
+        self.resume_generator(self.clear_generator)
+
+    def game_over_phase(self):
+        """
+        Sub-method of update(). Continues the game over animation.
+
+        :return: None
+        """
+        self.resume_generator(self.end_generator)
+
+    def resume_generator(self, generator):
+        """
+        Resumes the given phase generator, but only once the number of frames it yielded last time have passed.
+        A plain yield (of None) resumes the generator on the next frame.
+
+        :param generator: The line clear or game over generator to resume.
+        :type generator: generator
+        :return: None
+        """
+
+        # The generator is still waiting.
+        if self.frame_count < self.resume_frame:
+            return
+
+        # Resume the generator, and schedule the frame it should be resumed on next.
+        frames = next(generator)
+        self.resume_frame = self.frame_count + (frames or 1)
 
     def drop_phase(self):
         """
@@ -248,11 +416,16 @@ class Playfield(BasePanel):
         :return: None
         """
 
+        # Local references to the active tetromino and the gravity counter, which are used in every path.
+        # The counter is written back to its attribute once at the end.
+        tetromino = self.active_tetromino
+        gravity_counter = self.gravity_counter
+
         # check if the active tetromino should drop on this frame.
-        if self.gravity_counter > self.gravity:
+        if gravity_counter > self.gravity:
 
             # for when the active tetromino is already on the ground
-            if self.active_tetromino.is_on_ground():
+            if tetromino.is_on_ground():
 
                 # engage the lock phase to allow for lock delay.
                 self.in_lock_phase = True
@@ -261,7 +434,7 @@ class Playfield(BasePanel):
                 # not on the ground, so ensure no lock delay.
                 self.in_lock_phase = False
                 # apply gravity to the active tetromino piece.
-                self.active_tetromino.shift_down()
+                tetromino.shift_down()
                 # reset counter to ensure that lock delay is reset.
                 self.lock_counter = 0
 
@@ -271,30 +444,33 @@ class Playfield(BasePanel):
                     self.model.add_soft_drop_point()
 
             # the gravity counter must be reset, as the interval has passed
-            self.gravity_counter = 0
+            gravity_counter = 0
 
         # for when the tetromino should not drop on this frame.
         else:
 
             # if the space below the tetromino is empty
-            if not self.active_tetromino.is_on_ground():
+            if not tetromino.is_on_ground():
 
                 # no lock delay should be applied.
                 self.in_lock_phase = False
 
                 # increment the gravity counter.
-                self.gravity_counter += 1
+                gravity_counter += 1
 
             else:
                 # For when lock delay is being applied
                 if self.in_lock_phase:
                     # reset gravity counter if the tetromino is on ground.
-                    self.gravity_counter = 0
+                    gravity_counter = 0
 
                 # For when lock delay is not being applied
                 else:
                     # increment the gravity counter.
-                    self.gravity_counter += 1
+                    gravity_counter += 1
+
+        # Store the updated gravity counter.
+        self.gravity_counter = gravity_counter
 
     def lock_phase(self):
         """
@@ -306,11 +482,12 @@ class Playfield(BasePanel):
         # check whether or not the lock phase should even occur
         if self.in_lock_phase:
 
-            # increment the lock counter
-            self.lock_counter += 1
+            # increment the lock counter (keeping a local copy to compare with the lock delay)
+            lock_counter = self.lock_counter + 1
+            self.lock_counter = lock_counter
 
             # If the active tetromino should lock on this frame, where lock delay has ended
-            if self.lock_counter > self.lock_delay:
+            if lock_counter > self.lock_delay:
                 # Have the active tetromino locked, thus ending the lock phase.
                 self.lock_tetromino()
 
@@ -322,19 +499,12 @@ class Playfield(BasePanel):
         :return: None
         """
 
-        # check if the next tetromino should spawn on this frame
-        if self.entry_counter > self.entry_delay:
+        # check if the next tetromino should spawn on this frame (the frame scheduled for when entry delay ends)
+        if self.frame_count >= self.entry_frame:
 
             # make the model setup the next tetromino to be active.
             self.model.set_active_tetromino()
 
-            # reset the entry delay counter
-            self.entry_counter = 0
-
-        else:
-            # increment the entry delay counter
-            self.entry_counter += 1
-
     def set_tetromino(self, next_piece):
         """
         Sets the next tetromino piece to be placed onto the playfield.
@@ -387,11 +557,21 @@ class Playfield(BasePanel):
                 for block in blocks:
 
                     # Get the block’s row and column positions
-                    x = block.get_x_coord()
-                    y = block.get_y_coord()
+                    x = block.x_coord
+                    y = block.y_coord
+
+                    # Mark the cell of the block as occupied on its row (which stays set if it overlaps a block).
+                    self.row_masks[y] |= 1 << x
 
                     # Have it added to the grid data structure at the position, even if it overlaps
-                    self.matrix[y][x] = block
+                    self.matrix[y * self.grid_width + x] = block
+
+                    # Give the block the image it will be drawn with, if it does not have it yet.
+                    if block.sprite is None:
+                        block.sprite = Playfield.get_block_sprite(block.colour)
+
+                # The contents of the playfield have changed.
+                self.dirty = True
 
             # No collisions will occur if shifted upwards, so the tetromino is added
             else:
@@ -402,6 +582,9 @@ class Playfield(BasePanel):
             # Have the tetromino add itself to the playfield
             self.active_tetromino.add_to_grid()
 
+        # The flags have changed, so the state must be updated.
+        self.update_state()
+
     def shift_tetromino_left(self):
         """
         Shifts the tetromino piece one space to the left.
@@ -436,11 +619,10 @@ class Playfield(BasePanel):
         """
 
         # get the block held at the position given by the parameters.
-        block = self.matrix[y][x]
+        block = self.matrix[y * self.grid_width + x]
 
-        # In case no block was found (to assist with debugging):
-        if block is None:
-            raise ValueError("No block found on the grid at:\nrow " + str(y) + "\ncolumn " + str(x))
+        # In case no block was found (to assist with debugging - skipped when Python is run with -O):
+        assert block is not None, "No block found on the grid at:\nrow " + str(y) + "\ncolumn " + str(x)
 
         return block
 
@@ -453,17 +635,27 @@ class Playfield(BasePanel):
         :return: None
         """
 
-        # get the x and y coordinates of the Block instance passed.
-        x = block.get_x_coord()
-        y = block.get_y_coord()
+        # get the x and y coordinates of the Block instance passed, and the index of its cell in the matrix.
+        x = block.x_coord
+        y = block.y_coord
+        index = y * self.grid_width + x
 
-        # do not allow the block to be placed if there is already one at that position (to assist with debugging)
-        if not self.check_cell_empty(x, y):
-            raise ValueError("A block is already at the position:\nrow " + str(y) + "\ncolumn " + str(x))
+        # do not allow the block to be placed if there is already one at that position
+        # (to assist with debugging - skipped when Python is run with -O)
+        assert self.matrix[index] is None, "A block is already at the position:\nrow " + str(y) + "\ncolumn " + str(x)
 
-        else:
-            # add the block to the position if the cell is empty
-            self.matrix[y][x] = block
+        # add the block to the position, now that the cell is known to be empty
+        self.matrix[index] = block
+
+        # Give the block the image it will be drawn with, if it does not have it yet.
+        if block.sprite is None:
+            block.sprite = Playfield.get_block_sprite(block.colour)
+
+        # Mark the cell of the block as occupied on its row.
+        self.row_masks[y] |= 1 << x
+
+        # The contents of the playfield have changed.
+        self.dirty = True
 
     def remove_block(self, block):
         """
@@ -474,20 +666,146 @@ class Playfield(BasePanel):
         :return: None
         """
 
+        # get the coordinates of the block, and the index of its cell in the matrix.
+        x = block.x_coord
+        y = block.y_coord
+        index = y * self.grid_width + x
+
         # In case the block is not at the position, do not remove anything from the grid.
-        if not self.check_block_position(block):
-            # Debug message
-            raise ValueError("The block to remove is not located at its supposed position:\nrow "
-                             + str(block.get_y_coord())
-                             + "\ncolumn "
-                             + str(block.get_x_coord()))
-        else:
-            # get the coordinates of the block.
-            x = block.get_x_coord()
-            y = block.get_y_coord()
+        # (to assist with debugging - skipped when Python is run with -O)
+        assert self.matrix[index] is block, ("The block to remove is not located at its supposed position:\nrow "
+                                             + str(y)
+                                             + "\ncolumn "
+                                             + str(x))
+
+        # set the value stored at the coordinates to nothing, thus removing it from the grid.
+        self.matrix[index] = None
+
+        # Mark the cell of the block as empty on its row.
+        self.row_masks[y] &= ~(1 << x)
+
+        # The contents of the playfield have changed.
+        self.dirty = True
+
+    def add_blocks(self, blocks):
+        """
+        Places a group of blocks onto the grid together, such as the square units of a tetromino, at the positions
+        given by their coordinate attributes. Does the same as add_block() for each block, but in a single call.
+
+        :param blocks: The blocks to add to the grid
+        :type blocks: list(Block)
+        :return: None
+        """
+
+        # Local references to the attributes used for every block.
+        matrix = self.matrix
+        row_masks = self.row_masks
+        width = self.grid_width
+
+        for block in blocks:
 
-            # set the value stored at the coordinates to nothing, thus removing it from the grid.
-            self.matrix[y][x] = None
+            # get the x and y coordinates of the block, and the index of its cell in the matrix.
+            x = block.x_coord
+            y = block.y_coord
+            index = y * width + x
+
+            # do not allow the block to be placed if there is already one at that position
+            # (to assist with debugging - skipped when Python is run with -O)
+            assert matrix[index] is None, "A block is already at the position:\nrow " + str(y) + "\ncolumn " + str(x)
+
+            # add the block to the position, and mark its cell as occupied on its row.
+            matrix[index] = block
+            row_masks[y] |= 1 << x
+
+            # Give the block the image it will be drawn with, if it does not have it yet.
+            if block.sprite is None:
+                block.sprite = Playfield.get_block_sprite(block.colour)
+
+        # The contents of the playfield have changed.
+        self.dirty = True
+
+    def remove_blocks(self, blocks):
+        """
+        Removes a group of blocks from the grid together, such as the square units of a tetromino, at the positions
+        given by their own coordinates. Does the same as remove_block() for each block, but in a single call.
+
+        :param blocks: The blocks to be removed from the grid.
+        :type blocks: list(Block)
+        :return: None
+        """
+
+        # Local references to the attributes used for every block.
+        matrix = self.matrix
+        row_masks = self.row_masks
+        width = self.grid_width
+
+        for block in blocks:
+
+            # get the coordinates of the block, and the index of its cell in the matrix.
+            x = block.x_coord
+            y = block.y_coord
+            index = y * width + x
+
+            # In case the block is not at the position, do not remove anything from the grid.
+            # (to assist with debugging - skipped when Python is run with -O)
+            assert matrix[index] is block, ("The block to remove is not located at its supposed position:\nrow "
+                                            + str(y)
+                                            + "\ncolumn "
+                                            + str(x))
+
+            # set the value stored at the coordinates to nothing, and mark the cell as empty on its row.
+            matrix[index] = None
+            row_masks[y] &= ~(1 << x)
+
+        # The contents of the playfield have changed.
+        self.dirty = True
+
+    def move_blocks(self, blocks, positions):
+        """
+        Moves a group of blocks already on the grid, such as the square units of a tetromino, to the given positions,
+        in a single call and a single pass over the blocks. The group may move into cells that its own blocks are in.
+
+        :param blocks: The blocks to move.
+        :param positions: The (column, row) position to move each block to, in the same order as the blocks.
+        :type blocks: list(Block)
+        :type positions: list(tuple)
+        :return: None
+        """
+
+        # Local references to the attributes used for every block.
+        matrix = self.matrix
+        row_masks = self.row_masks
+        width = self.grid_width
+
+        for block, (x, y) in zip(blocks, positions):
+            old_x = block.x_coord
+            old_y = block.y_coord
+            old_index = old_y * width + old_x
+
+            """
+            Take the block out of its old cell, unless another block of the group has already been moved into it
+            (in which case the cell stays occupied). Since each block only ever empties its own cell, a cell it is
+            moved into is never emptied afterwards, so the cells do not all need emptying before any are filled.
+            """
+            found = matrix[old_index]
+            if found is block:
+                matrix[old_index] = None
+                row_masks[old_y] &= ~(1 << old_x)
+
+            # In case the block is not at its position at all (to assist with debugging - skipped when Python is run
+            # with -O)
+            assert found is block or found in blocks, ("The block to move is not located at its supposed position:"
+                                                       + "\nrow " + str(old_y)
+                                                       + "\ncolumn " + str(old_x))
+
+            # Then place the block in its new cell, updating its coordinates to match.
+            block.x_coord = x
+            block.y_coord = y
+            matrix[y * width + x] = block
+            row_masks[y] |= 1 << x
+
+        # The contents of the playfield have changed.
+        self.dirty = True
 
     def check_cell_empty(self, x, y):
         """
@@ -502,7 +820,7 @@ class Playfield(BasePanel):
         """
 
         # get the apparent block from the grid at the position passed
-        block = self.matrix[y][x]
+        block = self.matrix[y * self.grid_width + x]
 
         # True if nothing is found at the position. False otherwise
         return block is None
@@ -519,11 +837,11 @@ class Playfield(BasePanel):
         """
 
         # Get the apparent coordinates of where the block is stored at
-        x = block.get_x_coord()
-        y = block.get_y_coord()
+        x = block.x_coord
+        y = block.y_coord
 
         # get the Block instance found at that position
-        block_found = self.matrix[y][x]
+        block_found = self.matrix[y * self.grid_width + x]
 
         """
         Return True if the Block object found is the same instance as the Block object passed as a parameter.
@@ -542,14 +860,45 @@ class Playfield(BasePanel):
         :return: bool value
         """
 
-        # will be out of bounds if x is not 0 - (9)
-        if x < 0 or x > self.grid_width - 1:
-            return False
+        # will be in bounds if x is 0 - (9) and y is 0 - (21)
+        return 0 <= x < self.grid_width and 0 <= y < self.grid_height
+
+    def check_positions_free(self, positions, owner):
+        """
+        Checks whether or not a group of blocks could be placed at the given positions on the grid, such as when
+        validating a tetromino move. The bounds and cell checks are done directly on the matrix in a single loop,
+        rather than through separate method calls for every position.
+        Returns true if every position lies within the grid boundaries and is either empty or occupied by one of the
+        group's own blocks.
+        Returns false otherwise.
+
+        :param positions: the (column, row) positions to check.
+        :param owner: the tetromino whose blocks are being moved, which do not count as collisions.
+        :type positions: iterable(tuple)
+        :type owner: tetromino.Tetromino
+        :return: bool value
+        """
+
+        # Local references to the attributes used for every position.
+        matrix = self.matrix
+        width = self.grid_width
+        height = self.grid_height
+
+        for x, y in positions:
+
+            # The position is not free if it is outside of the grid boundaries.
+            if not (0 <= x < width and 0 <= y < height):
+                return False
+
+            # Get the apparent block at the position.
+            block_found = matrix[y * width + x]
 
-        # will be out of bounds if x is not 0 - (21)
-        if y < 0 or y > self.grid_height - 1:
-            return False
+            # An occupied position only counts as a collision if the block is not from the same group
+            # (it has a different owner).
+            if block_found is not None and block_found.owner is not owner:
+                return False
 
+        # At this point, no collisions were found.
         return True
 
     def activate_soft_drop(self):
@@ -605,6 +954,9 @@ class Playfield(BasePanel):
             # Otherwise, go through the pattern phase – check if any rows should be cleared
             self.pattern_phase()
 
+        # The flags have changed, so the state must be updated.
+        self.update_state()
+
     def rotate_clockwise(self):
         """
         Used to rotate the active tetromino 90 degrees clockwise.
@@ -636,11 +988,14 @@ class Playfield(BasePanel):
         :return: integer value of row index.
         """
 
+        # Local reference to the occupied cells of each row.
+        row_masks = self.row_masks
+
         # Loop through each row index of the playfield
         for row in range(0, self.grid_height - 1):
 
             # Once a row is found to not be empty, then this is the top row with at least one block.
-            if not self.check_row_empty(row):
+            if row_masks[row]:
                 return row
 
         # -1 is returned if all rows are empty.
@@ -655,18 +1010,8 @@ class Playfield(BasePanel):
         :type row: int
         :return: None
         """
-        # Get the row of blocks from grid at position given by the row index passed
-        block_row = self.matrix[row]
-
-        # Loop through each (apparent) block on the row
-        for block in block_row:
-            # If the not a ‘null’ type, then this must be a block
-            if block is not None:
-                # This means that the row is not empty
-                return False
-
-        # At this point, all elements of the row are null, so it is empty
-        return True
+        # The row is empty if none of its cells are marked as occupied.
+        return self.row_masks[row] == 0
 
     def check_grid_empty(self):
         """
@@ -675,15 +1020,8 @@ class Playfield(BasePanel):
 
         :return: None
         """
-        # Loop through each row index of the grid
-        for row in range(0, self.grid_height):
-
-            # If the row is not empty, then the grid is not completely empty
-            if not self.check_row_empty(row):
-                return False
-
-        # At this point, all rows are checked, and they are empty. Therefore the whole grid is empty.
-        return True
+        # The grid is empty if none of the cells of any of its rows are marked as occupied.
+        return not any(self.row_masks)
 
     def pattern_phase(self):
         """
@@ -692,27 +1030,23 @@ class Playfield(BasePanel):
         :return: None
         """
 
-        # Define an empty list, to hold the row indexes of full blocks
-        full_rows = list()
-
-        # Get the row indexes of where the active tetromino locked
-        block_rows = self.active_tetromino.get_rows()
-
-        # Iterate through each row the active tetromino locked at
-        for row_index in block_rows:
+        # Collect the indexes of the rows the active tetromino locked at which are now full.
+        check_row_full = self.check_row_full
+        full_rows = [row_index for row_index in self.active_tetromino.get_rows() if check_row_full(row_index)]
 
-            # Check whether or not the row is full
-            if self.check_row_full(row_index):
-                # Add it the full_rows list if full
-                full_rows.append(row_index)
-
-        # If the full_rows list is not empty, then it means that at least one line needs to be cleared.
-        if len(full_rows) > 0:
+        """
+        If the full_rows list is not empty, then it means that at least one line needs to be cleared.
+        Otherwise the line clear phase is skipped altogether, without creating a generator for it, so locks that clear
+        no lines go straight on to the spawn phase.
+        """
+        if full_rows:
             # The line clear phase should now be gone through
             self.in_clear_phase = True
 
             # Set the attribute to a new generator object of the line_clear_generator() generator method
             self.clear_generator = self.line_clear_generator(full_rows)
+            # It should be first resumed on the next frame.
+            self.resume_frame = 0
 
     def check_row_full(self, row):
         """
@@ -723,18 +1057,8 @@ class Playfield(BasePanel):
         :type row: int
         :return: None
         """
-        # Get the row of blocks from grid at position given by the row index passed
-        block_row = self.matrix[row]
-
-        # Loop through each (apparent) block on the row
-        for block in block_row:
-            # If it is a ‘null’ type, then the cell is empty
-            if block is None:
-                # This means that the row is not full
-                return False
-
-        # At this point, all elements of the row list are blocks, so it is full
-        return True
+        # The row is full if every one of its cells is marked as occupied.
+        return self.row_masks[row] == self.full_row_mask
 
     def check_lock_out(self):
         """
@@ -766,43 +1090,42 @@ class Playfield(BasePanel):
         :type full_rows: list(int)
         """
 
-        # No need to shift any rows if the grid is completely cleared
-        if self.check_grid_empty():
-            return
-
-        # Loop through each index of the full_rows list
-        for i in range(0, len(full_rows)):
-
-            """
-            Shift from the top row of blocks, to the cleared row currently pointed to
-            """
-            start_row = self.get_top_block_row()
-            end_row = full_rows[i]
-
-            """
-            Define variable to temporarily store block rows on the grid.
-            """
-            # Start with the top block row.
-            temp_blocks = self.matrix[start_row]
+        """
+        Since the rows of the matrix are stored one after another, the cells of each cleared row can be taken out of
+        the matrix as a whole, then new empty rows of cells inserted at the top in their place all at once. This moves
+        every row above the cleared rows down in a single step, rather than swapping the rows one at a time.
+        The rows must be removed from the bottom-most to the top-most, so that the indexes of the rows yet to be removed
+        (which are above) are not changed by the cells after them moving back.
+        Cleared rows are usually next to each other, so each run of adjacent rows is removed with a single slice.
+        """
+        width = self.grid_width
+        rows = sorted(full_rows, reverse=True)
 
-            # Empty the start row of blocks from the grid, as they need to be shifted downwards.
-            self.clear_row(start_row)
+        index = 0
+        while index < len(rows):
 
-            # Loop from the start and end row indexes.
-            for y in range(start_row, end_row):
+            # Find the top-most row of the run of adjacent cleared rows starting at this row.
+            bottom_row = top_row = rows[index]
+            index += 1
+            while index < len(rows) and rows[index] == top_row - 1:
+                top_row -= 1
+                index += 1
 
-                # Temporarily hold the block list at current index
-                blocks = self.matrix[y+1]
+            # Remove the cells of the cleared rows from the grid, along with their row masks.
+            del self.matrix[top_row * width:(bottom_row + 1) * width]
+            del self.row_masks[top_row:bottom_row + 1]
 
-                # Remove that row of blocks from the grid, replacing it with the blocks held by temp_blocks.
-                self.matrix[y+1] = temp_blocks
+        # Add a new empty row of cells for each cleared row to the top of the grid, so it keeps the same number of rows.
+        self.matrix[0:0] = self.empty_row * len(full_rows)
+        self.row_masks[0:0] = [0] * len(full_rows)
 
-                # Now have temp_blocks hold the blocks that were removed.
-                temp_blocks = blocks
+        # The contents of the playfield have changed.
+        self.dirty = True
 
     def line_clear_generator(self, full_rows):
         """
-        A Python generator used to carry out the line clear phase
+        A Python generator used to carry out the line clear phase.
+        Only created when there is at least one line to clear.
 
         :param full_rows: the row indexes of the playfield that are completely filled with blocks.
         :type full_rows: list(int)
@@ -815,38 +1138,48 @@ class Playfield(BasePanel):
         # Get the number of lines to be cleared
         num_of_lines = len(full_rows)
 
+        # Work out where each line to clear starts in the matrix once, rather than for every block removed.
+        width = self.grid_width
+        matrix = self.matrix
+        row_masks = self.row_masks
+        row_starts = tuple((row_index, row_index * width) for row_index in full_rows)
+
+        # Use a frame timer to allow for delays between each 'animation' frame, so it plays less quickly.
+        frame_interval = 1
+
+        # The number of frames each step of the animation takes (the frame a block is removed, then the frame interval).
+        step_frames = 1 + frame_interval
+
         """
         This loop clears one block on each line per frame, resulting in a clear animation.
         """
         # Loop through each column index of the playfield
-        for x in range(0, self.grid_width):
+        for x in range(0, width):
+
+            # The bits of every row mask except the one for this column.
+            keep_mask = ~(1 << x)
 
             # Loop through each row index of the lines to clear
-            for row_index in full_rows:
+            for row_index, start in row_starts:
                 # Use the indexes to remove the block from the grid data structure
-                self.matrix[row_index][x] = None
+                matrix[start + x] = None
 
-            # Increment delay counter
-            delay_counter += 1
-            # Exit the generator, returning to this point after it is called again.
-            yield
+                # Mark the cell as empty on the row.
+                row_masks[row_index] &= keep_mask
 
-            # Use a frame timer to allow for delays between each 'animation' frame, so it plays less quickly.
-            frame_interval = 1
-
-            # Wait until the frame interval have passed
-            for i in range(0, frame_interval):
-                # Still increment the delay counter
-                delay_counter += 1
-                # Exit the generator - will continue from this point when next called
-                yield
-
-        # Wait until the delay has ended
-        while delay_counter <= self.clear_delay:
-            # Increment delay counter
-            delay_counter += 1
-            # Exit the generator, returning to this point after it is called again.
-            yield
+            # The contents of the playfield have changed.
+            self.dirty = True
+
+            # Increment delay counter, for this frame and the frame interval.
+            delay_counter += step_frames
+            # Exit the generator, returning to this point once this frame and the frame interval have passed.
+            yield step_frames
+
+        # Wait until the delay has ended (counting the frame the generator is resumed on).
+        remaining_frames = self.clear_delay + 1 - delay_counter
+        if remaining_frames > 0:
+            # Exit the generator, returning to this point once the rest of the delay has passed.
+            yield remaining_frames
 
         """
         At this point, the delay has been passed.
@@ -856,6 +1189,7 @@ class Playfield(BasePanel):
 
         # End the clear phase
         self.in_clear_phase = False
+        self.update_state()
 
         # Increase the number of lines cleared, and update the current level
         self.model.increase_lines(num_of_lines)
@@ -880,8 +1214,15 @@ class Playfield(BasePanel):
         :return: None
         """
 
-        # Set the row to a new empty list with the grid width size.
-        self.matrix[row_index] = [None] * self.grid_width
+        # Set the cells of the row to empty.
+        start = row_index * self.grid_width
+        self.matrix[start:start + self.grid_width] = self.empty_row
+
+        # There are no longer any blocks on the row.
+        self.row_masks[row_index] = 0
+
+        # The contents of the playfield have changed.
+        self.dirty = True
 
     def game_over_generator(self):
         """
@@ -894,42 +1235,37 @@ class Playfield(BasePanel):
         # Define the initial delay frame time
         delay = 60
 
-        # Define a counter for the delay
-        delay_counter = 0
-
         """
         Wait until the delay has ended
         """
-        # Loop until the delay time has passed
-        while delay_counter <= delay:
-
-            # Increment the delay counter
-            delay_counter += 1
-            # Exit the generator - will continue from this point when next called
-            yield
+        # Exit the generator - will continue from this point once the delay time has passed (including the frame the
+        # generator is resumed on).
+        yield delay + 1
 
         """
         Animation for game over – clearing remaining blocks from grid
         """
 
+        # Local references to the grid data, as a row is emptied on every step of the animation.
+        width = self.grid_width
+        matrix = self.matrix
+        row_masks = self.row_masks
+        empty_row = self.empty_row
+
         # Starting from the top row, loop through each row index from the largest to the smallest.
         for row_index in range(0, self.grid_height):
 
-            # Clear the row
-            self.clear_row(row_index)
-
-            # Exit the generator - will continue from this point when next called
-            yield
+            # Clear the row (the same as clear_row(), without the method call).
+            start = row_index * width
+            matrix[start:start + width] = empty_row
+            row_masks[row_index] = 0
+            self.dirty = True
 
             # The number of frames to wait until the next row is cleared
             clear_frames = 3
 
-            # Wait until the frame timer reaches 0
-            while clear_frames > 0:
-                # Decrement the frame timer
-                clear_frames -= 1
-                # Exit the generator - will continue from this point when next called
-                yield
+            # Exit the generator - will continue from this point once this frame and the frame timer have passed.
+            yield 1 + clear_frames
 
         """
         End of generator
@@ -948,5 +1284,49 @@ class Playfield(BasePanel):
         :type is_visible: bool
         :return: None
         """
+        # The screen only needs redrawing if the visibility is actually changing.
+        if self.grid_visible != is_visible:
+            self.dirty = True
+
         # Simply set the parameter to the attribute used for this purpose.
         self.grid_visible = is_visible
+
+    def reset(self):
+        """
+        Resets the state of the playfield back to its original state, to allow for the game to be played again.
+        The playfield's display surface is kept, so it does not need to be created again.
+
+        :return: None
+        """
+
+        # Empty the grid of all blocks.
+        self.matrix = [None] * (self.grid_width * self.grid_height)
+        self.row_masks = [0] * self.grid_height
+
+        self.active_tetromino = None
+
+        # Re-calculate the gravity value, for the (reset) level.
+        self.gravity = self.model.calculate_gravity()
+
+        # Reset the frame counters.
+        self.gravity_counter = 0
+        self.lock_counter = 0
+        self.frame_count = 0
+        self.entry_frame = 0
+        self.resume_frame = 0
+
+        # Reset the state flags.
+        self.in_lock_phase = False
+        self.tetromino_isactive = False
+        self.in_clear_phase = False
+        self.game_over = False
+        self.soft_drop_isactive = False
+        self.grid_visible = True
+        self.update_state()
+
+        # Use a new game over generator, since the previous one may have already been used up.
+        self.end_generator = self.game_over_generator()
+        self.clear_generator = None
+
+        # The contents of the playfield have changed.
+        self.dirty = True
@@ -5,6 +5,35 @@ from info_panel import InfoPanel
 
 class ScorePanel(InfoPanel):
 
+    LINE_POINTS = (0, 40, 100, 300, 1200)
+    """
+    The points gained from clearing lines at level 1, indexed by the number of lines cleared.
+
+    SCORE MODIFIERS:
+
+    40 points for 1 line
+    100 points for 2 lines
+    300 points for 3 lines
+    1200 points for 4 lines (maximum possible)
+    """
+
+    LINE_POINTS_TABLE = ()
+    """
+    The points gained from clearing lines for each level from 1 to 30, indexed by [level - 1][number of lines].
+    Calculated once (just after the class is defined), so the points do not need to be worked out each time lines are
+    cleared.
+    """
+
+    SCORES_FILE = "high-scores.json"
+    """The file name of the data file storing the high scores of the game."""
+
+    scores_data = None
+    """
+    The JSON object (represented by a Python dictionary) loaded from the high scores data file.
+    Shared by the class, and only read from the file the first time it is needed, as the file is only changed through
+    update_scores(), which keeps this up to date.
+    """
+
     def __init__(self):
         """
         The panel class used to represent a container component that is dedicated for displaying the current score
@@ -20,6 +49,8 @@ class ScorePanel(InfoPanel):
         # Alter the rect coordinates.
         self.rect_coords.right = 320  # x-coordinate of the right side of the panel is set.
         self.rect_coords.top = 10  # y-coordinate of the top of the panel is set.
+        # Record the new position the surface will be drawn at.
+        self.blit_position = self.rect_coords.topleft
 
         self.score = 0
         """Stores the value of the player's current score."""
@@ -33,7 +64,55 @@ class ScorePanel(InfoPanel):
         """ Used to hold the string that will be used as the label text for the high score value displayed in the panel
         """
 
-        # Set the high score value displayed to the highest score stored in the data file.
+        # The labels never change, so their surface images only need to be created once.
+        self.score_label_text = InfoPanel.create_text(self.score_label)
+        """The surface image of the score label text, drawn onto the panel each time it is set up."""
+        self.high_label_text = InfoPanel.create_text(self.high_score_label)
+        """The surface image of the high score label text, drawn onto the panel each time it is set up."""
+
+        self.score_text = None
+        """
+        The surface image of the current score value, kept until the score changes.
+        None when it needs to be created again.
+        """
+        self.high_score_text = None
+        """
+        The surface image of the high score value, kept until the high score changes.
+        None when it needs to be created again.
+        """
+
+        """
+        The text is always laid out the same way, so the positions of the text surfaces only need to be worked out once.
+        Since the text is drawn on the panel, its rect coordinates are relative to the panel rather than the screen.
+        """
+        # Every value text surface has the same height, as they are all rendered with the same font.
+        value_height = InfoPanel.create_text(f"{self.score:06d}").get_height()
+
+        # local y-coordinate of the top of the label text surface is set.
+        self.high_label_rect = self.high_label_text.get_rect()
+        """The local rectangular coordinates the high score label text is drawn at on the panel."""
+        self.high_label_rect.top = 5
+        """
+        local x position of the centre of the label text is set to half the width of the surface so it is positioned
+        at the centre of the surface.
+        """
+        self.high_label_rect.centerx = self.rect_coords.width // 2
+
+        # the top of the high score text surface will be 5 pixels below its label.
+        self.high_score_position = (10, self.high_label_rect.bottom + 5)
+        """The local top-left coordinates the high score value text is drawn at on the panel."""
+
+        # the top of the current score label text surface will be 10 pixels below the high score value text surface.
+        self.score_label_rect = self.score_label_text.get_rect()
+        """The local rectangular coordinates the score label text is drawn at on the panel."""
+        self.score_label_rect.top = self.high_score_position[1] + value_height + 10
+        self.score_label_rect.left = 10
+
+        # the top of the current score text surface will be 5 pixels below its label.
+        self.score_position = (10, self.score_label_rect.bottom + 5)
+        """The local top-left coordinates the current score value text is drawn at on the panel."""
+
+        # Set the high score value displayed to the highest score in the scores data kept in memory.
         self.set_high_score()
 
     def add_points(self, points):
@@ -46,6 +125,10 @@ class ScorePanel(InfoPanel):
         """
         self.score += points
 
+        # The score displayed has changed, so its text image must be created again.
+        self.score_text = None
+        self.dirty = True
+
     def get_high_score(self):
         """
         returns the high score of the game.
@@ -65,47 +148,19 @@ class ScorePanel(InfoPanel):
         # Clear the surface before redrawing.
         self.clear_surface()
 
-        # Create surface images of the label text and scores text
-        score_label_text = InfoPanel.create_text(self.score_label)
-        high_label_text = InfoPanel.create_text(self.high_score_label)
-
+        # Create surface images of the scores text, only for the values that have changed since they were last created.
+        # (the label text images are created once in the constructor).
         # The current score and high score text will have at least 6 digits.
-        score_text = InfoPanel.create_text(str(self.score).zfill(6))
-        high_score_text = InfoPanel.create_text(str(self.high_score).zfill(6))
-
-        # Get the rectangular coordinates of the text surfaces to modify them.
-        score_label_rect = score_label_text.get_rect()
-        high_label_rect = high_label_text.get_rect()
-        score_rect = score_text.get_rect()
-        high_score_rect = high_score_text.get_rect()
-
-        """Since the text is drawn on the panel, its rect coordinates are relative to the panel
-        rather than the screen"""
-        # local y-coordinate of the top of the label text surface is set.
-        high_label_rect.top = 5
-        """
-        local x position of the centre of the label text is set to half the width of the surface so it is positioned
-        at the centre of the surface.
-        """
-        high_label_rect.centerx = self.rect_coords.width // 2
-
-        # the top of the high score text surface will be 5 pixels below its label.
-        high_score_rect.top = high_label_rect.bottom + 5
-        high_score_rect.left = 10
-
-        # the top of the current score label text surface will be 10 pixels below the high score value text surface.
-        score_label_rect.top = high_score_rect.bottom + 10
-        score_label_rect.left = 10
+        if self.score_text is None:
+            self.score_text = InfoPanel.create_text(f"{self.score:06d}")
+        if self.high_score_text is None:
+            self.high_score_text = InfoPanel.create_text(f"{self.high_score:06d}")
 
-        # the top of the current score text surface will be 5 pixels below its label.
-        score_rect.top = score_label_rect.bottom + 5
-        score_rect.left = 10
-
-        # Draw all texts onto the display surface at the position given by their corresponding rectangular coordinates.
-        self.display_surface.blit(high_label_text, high_label_rect)
-        self.display_surface.blit(score_label_text, score_label_rect)
-        self.display_surface.blit(high_score_text, high_score_rect)
-        self.display_surface.blit(score_text, score_rect)
+        # Draw all texts onto the display surface at the positions worked out in the constructor.
+        self.display_surface.blit(self.high_label_text, self.high_label_rect)
+        self.display_surface.blit(self.score_label_text, self.score_label_rect)
+        self.display_surface.blit(self.high_score_text, self.high_score_position)
+        self.display_surface.blit(self.score_text, self.score_position)
 
     def score_lines(self, lines, level):
         """
@@ -116,86 +171,110 @@ class ScorePanel(InfoPanel):
         :return: None
         """
 
-        # Define a dictionary that acts as a 'switch/case' for calculating the points.
-        """
-        SCORE MODIFIERS:
-        
-        40 points for 1 line
-        100 points for 2 lines
-        300 points for 3 lines
-        1200 points for 4 lines (maximum possible)
-        """
-        points_dict = {"1": 40,
-                       "2": 100,
-                       "3": 300,
-                       "4": 1200
-                       }
+        # Look up the points gained if the level and number of lines are within the pre-calculated range.
+        if level <= len(ScorePanel.LINE_POINTS_TABLE) and 0 <= lines <= 4:
+            points = ScorePanel.LINE_POINTS_TABLE[level - 1][lines]
+
+        # Otherwise calculate the number of points gained from the points for level 1.
+        elif 0 <= lines < len(ScorePanel.LINE_POINTS):
+            points = ScorePanel.LINE_POINTS[lines] * level
 
-        # Calculate the number of points gained. If the number of lines is invalid, the result will be 0.
-        points = points_dict.get(str(lines), 0) * level
+        else:
+            # If the number of lines is invalid, no points are gained.
+            points = 0
 
         # Add the points to the score.
         self.score += points
 
-    def set_high_score(self):
+        # The score displayed has changed, so its text image must be created again.
+        self.score_text = None
+        self.dirty = True
 
-        file_dir = "high-scores.json"
+    @classmethod
+    def load_scores_data(cls):
+        """
+        Returns the JSON object stored in the high scores data file, only reading the file the first time it is called.
 
-        # Open the high scores data file for reading
-        with open(file_dir, 'r') as json_file:
+        :return: A dictionary of the high scores data.
+        """
 
-            # Load the data as a JSON object (represented by a Python dictionary)
-            json_data = json.load(json_file)
-            # Get the list of scores mapped by the "high scores" key
-            scores_list = json_data["high scores"]
+        # The data has not been read from the file yet.
+        if cls.scores_data is None:
 
-            # The high score attribute will be set to the greatest value stored in the list.
-            self.high_score = max(scores_list)
+            # Open the high scores data file for reading
+            with open(cls.SCORES_FILE, 'r') as json_file:
 
-            # Close the file
-            json_file.close()
+                # Load the data as a JSON object (represented by a Python dictionary)
+                cls.scores_data = json.load(json_file)
 
-    def update_scores(self):
+        return cls.scores_data
 
-        file_dir = "high-scores.json"
+    def set_high_score(self):
+
+        # Get the list of scores mapped by the "high scores" key
+        scores_list = ScorePanel.load_scores_data()["high scores"]
 
-        # Open the high scores data file for reading
-        with open(file_dir, 'r') as json_file:
+        # The high score attribute will be set to the greatest value stored in the list.
+        self.high_score = max(scores_list)
 
-            # Load the data as a JSON object (represented by a Python dictionary)
-            json_data = json.load(json_file)
+        # The high score displayed has changed, so its text image must be created again.
+        self.high_score_text = None
+        self.dirty = True
+
+    def update_scores(self):
 
-            # Close the file
-            json_file.close()
+        # Get the high scores data, which is kept in memory after it is first read from the file.
+        json_data = ScorePanel.load_scores_data()
 
         # Get the list of scores mapped by the "high scores" key
         scores_list = json_data["high scores"]
 
-        # The score will only be stored if it is greater than the minimum value stored in the list.
-        if not self.score > min(scores_list):
-            # Exit the method if the score is not high enough to be stored.
-            return
-
         # First sort the array in descending order in case it isn’t already
         scores_list.sort(reverse=True)
 
-        # Get the index that points to the end of the list
-        end_index = len(scores_list) - 1
-
-        # Add the player’s score to this position.
-        scores_list[end_index] = self.score
+        # The score will only be stored if it is greater than the minimum value stored in the list (now the last one).
+        if not self.score > scores_list[-1]:
+            # Exit the method if the score is not high enough to be stored.
+            return
 
-        # Sort the list again in descending order.
-        scores_list.sort(reverse=True)
+        """
+        Since the list is already in (descending) order, insert the player's score straight into its place: after every
+        score that is at least as high. The scan always stops within the list, as the score beats the last one.
+        """
+        index = 0
+        while scores_list[index] >= self.score:
+            index += 1
+        scores_list.insert(index, self.score)
 
-        # Set the value mapped by the "high scores" key to this updated list.
-        json_data["high scores"] = scores_list
+        # Remove the lowest score, so the list keeps the same length.
+        scores_list.pop()
 
-        # Open the high scores data file again, this time for writing
-        with open(file_dir, 'w') as json_file:
+        """
+        The file only needs to be written to now that the scores have changed. It does not need to be read again first,
+        as the data in memory is kept the same as the file.
+        """
+        with open(ScorePanel.SCORES_FILE, 'w') as json_file:
 
             # Overwrite the JSON file with the updated scores list.
             json.dump(json_data, json_file, indent=4)
 
-            # Close the file
-            json_file.close()
+    def reset(self):
+        """
+        Resets the score back to its original state, to allow for the game to be played again.
+        The high score is looked up again from the high scores kept in memory, since they may have just been updated.
+
+        :return: None
+        """
+        self.score = 0
+        self.score_text = None
+
+        # Set the high score value displayed to the highest score in the scores data kept in memory.
+        self.set_high_score()
+
+        # The values displayed have changed.
+        self.dirty = True
+
+
+# Work out the points table from the points at level 1, now that the class has been defined.
+ScorePanel.LINE_POINTS_TABLE = tuple(tuple(points * level for points in ScorePanel.LINE_POINTS)
+                                     for level in range(1, 31))
@@ -1,5 +1,4 @@
 import pygame
-import random
 import constants
 
 from playfield import Playfield
@@ -11,8 +10,83 @@ class Tetromino(object):
     The class used as the basic template for all the variants of the tetromino shapes used in the game.
     """
 
-    current_bag = []
-    """Stores (in a list) the current set of tetromino classes used to generate each piece in a random order"""
+    images_built = False
+    """Determines whether or not the images of the tetromino classes have been built yet"""
+
+    image = None
+    """
+    The image of the tetromino shape, displayed on the Next Queue.
+    Built for each derived class by build_images(), once the display mode has been set.
+    """
+
+    # A 'vector' stored for each square unit for each orientation.
+    block_positions = (((0, 0),) * 4,)
+    """
+    Holds the relative coordinate positions (from the tetromino's origin position) of each square unit
+    of the tetromino piece, for each orientation.
+    Set by each derived class as a class attribute, so every piece of the same shape shares the same positions rather
+    than building its own copy of them when created.
+    """
+
+    rotation_pivot = None
+    """
+    The point (relative to the tetromino's origin) that every orientation of the tetromino is a clockwise quarter turn
+    of the previous one about, or None if its orientations are listed by hand.
+    Given by a derived class along with the number of orientations, to have its block positions generated from the
+    first orientation only.
+    """
+
+    orientation_count = 1
+    """The number of orientations of the tetromino, when they are generated about its rotation pivot."""
+
+    rotation_table = ((0, 0, 0),)
+    """
+    The rotation index each orientation changes to, indexed by [rotation index][dr], where dr is the direction of
+    rotation (1 for clockwise, -1 for anticlockwise, or 0 for none). The index is circular - meaning it will cycle from
+    0 to the highest index of block_positions. Worked out for each derived class once it is defined.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Called whenever a class is derived from the Tetromino class, once it has been defined, to work out its rotation
+        table from its block positions (generating them first, if the class has a rotation pivot).
+        """
+        super().__init_subclass__(**kwargs)
+
+        # Generate every orientation from the first one, by turning each orientation a quarter turn clockwise
+        # about the pivot to get the next.
+        if cls.rotation_pivot is not None:
+            orientations = [cls.block_positions[0]]
+            for index in range(1, cls.orientation_count):
+                orientations.append(Tetromino.rotate_positions(orientations[-1], cls.rotation_pivot))
+            cls.block_positions = tuple(orientations)
+
+        # Get the number of possible orientation of the tetromino
+        n = len(cls.block_positions)
+
+        # For each orientation, the same index, then the next index (clockwise), then the previous one (anticlockwise),
+        # so that a dr of -1 picks the last item.
+        cls.rotation_table = tuple((index, (index + 1) % n, (index - 1) % n) for index in range(n))
+
+    @staticmethod
+    def rotate_positions(positions, pivot):
+        """
+        Turns a set of relative block positions a quarter turn clockwise about the pivot point given.
+        Since the y-axis points downwards, (x, y) is moved to (cx + cy - y, cy - cx + x) for a pivot of (cx, cy).
+
+        :param positions: the relative (x, y) positions of each square unit of the tetromino.
+        :param pivot: the (x, y) point to turn the positions about - either a grid point or the centre of a square.
+        :type positions: tuple
+        :type pivot: tuple
+        :return: tuple of (x, y) tuples
+        """
+
+        # Since the pivot is always either on a grid point or the centre of a square, these always come out as whole
+        # numbers (but may be floats), so are rounded to get integer positions.
+        x_offset = round(pivot[0] + pivot[1])
+        y_offset = round(pivot[1] - pivot[0])
+
+        return tuple((x_offset - y, y_offset + x) for x, y in positions)
 
     def __init__(self, display_colour, image, playfield):
         """
@@ -41,13 +115,6 @@ class Tetromino(object):
         self.square_units = [None] * 4
         """Holds the four square units that make up the tetromino piece"""
 
-        # A 'vector' stored for each square unit for each orientation.
-        self.block_positions = [[[0] * 2 for i in range(4)]]
-        """
-        Holds the relative coordinate positions (from the tetromino's origin position) of each square unit
-        of the tetromino piece, for each orientation
-        """
-
         self.rotation_index = 0
         """ 
         Stores the current index used from the block_positions 3D list, to keep track of the tetromino's current
@@ -57,6 +124,28 @@ class Tetromino(object):
         self.grid = playfield
         """A reference to the playfield the tetromino is placed on"""
 
+    def reset(self):
+        """
+        Resets the tetromino back to its original state, so that the same instance can be used again as a new piece
+        after it has been locked onto the playfield.
+        The blocks it locked with are left on the playfield, and new ones are created when it is next set up.
+
+        :return: None
+        """
+        self.x_coord = 0
+        self.y_coord = 0
+
+        # The locked blocks on the playfield are no longer treated as part of this tetromino.
+        for block in self.square_units:
+            if block is not None:
+                block.owner = None
+
+        # Forget the locked blocks (a new list of blocks is created when it is next set up).
+        self.square_units = [None] * 4
+
+        # Start from the original orientation.
+        self.rotation_index = 0
+
     @staticmethod
     def get_tetromino_set():
         """
@@ -67,51 +156,45 @@ class Tetromino(object):
         return ShapeI, ShapeJ, ShapeL, ShapeO, ShapeS, ShapeT, ShapeZ
 
     @staticmethod
-    def random_generator(playfield):
+    def build_images():
         """
-        A Python generator, used to generate sequences of tetromino objects in a random order, out of all the 7 types.
-        Only one is returned per call - using next()
+        Builds the image of every tetromino class, drawing a square for each square unit of its original orientation.
+        The images are converted to the same pixel format as the screen, so they do not need converting each time they
+        are drawn. Therefore this must only be called once the display mode has been set (and only has an effect the
+        first time).
 
-        :param playfield: a reference to the Playfield component
-        :return: an instance of one of the Tetromino derived classes
+        :return: None
         """
 
-        # Get the tetromino set holding all the tetromino class types
-        tetromino_set = Tetromino.get_tetromino_set()
+        # The images have already been built.
+        if Tetromino.images_built:
+            return
 
-        # Infinite loop, to continuously generate random sets of tetrominoes with no limit
-        while True:
-            # Create a copy of the set of tetromino class types and store it.
-            bag = list(tetromino_set)
-            # Arrange the tetromino derived classes in a random order
-            random.shuffle(bag)
+        # get the scale of each grid square unit from the Playfield class (the same for every image)
+        scale = Playfield.get_square_size()
 
-            # loop through each class type element to return a new instance of each tetromino class in turn
-            for tetromino in bag:
-                # Return a new tetromino class instance, and 'halt' the generator until the next call.
-                yield tetromino(playfield)
+        for tetromino_type in Tetromino.get_tetromino_set():
 
-    @staticmethod
-    def create_surface(width_units, height_units):
-        """
-        Returns a new image with a width and height in terms of the square size of the playfield units.
+            # The relative positions of the square units in the original orientation.
+            block_vectors = tetromino_type.block_positions[0]
 
-        :param width_units: The width of the image in multiples of the square size of the playfield.
-        :param height_units: The height of the image in multiples of the square size of the playfield.
-        :type width_units: int
-        :type height_units: int
-        :return: A pygame Surface object which represents the image.
-        """
-        # get the scale of each grid square unit from the Playfield class
-        scale = Playfield.get_square_size()
+            # Find the top-left corner of the shape, and its width and height in units, so the image fits it exactly.
+            left = min(vector_x for vector_x, vector_y in block_vectors)
+            top = min(vector_y for vector_x, vector_y in block_vectors)
+            width_units = max(vector_x for vector_x, vector_y in block_vectors) - left + 1
+            height_units = max(vector_y for vector_x, vector_y in block_vectors) - top + 1
 
-        # specify the width and height of the tetromino image, in multiples of the grid scale size.
-        width = width_units * scale
-        height = height_units * scale
+            # create a surface object, with dimensions given in multiples of the grid scale size.
+            image = pygame.Surface((width_units * scale, height_units * scale))
 
-        # return a new Surface object with dimensions given by width and height passed to it.
-        return pygame.Surface((width, height))
-        # return pygame.Surface((width, height), pygame.SRCALPHA, 32)
+            # fill the region of each square unit with the RGB colour constant of the class
+            for vector_x, vector_y in block_vectors:
+                region = ((vector_x - left) * scale, (vector_y - top) * scale, scale, scale)
+                image.fill(tetromino_type.SURFACE_COLOUR, region)
+
+            tetromino_type.image = image.convert()
+
+        Tetromino.images_built = True
 
     def get_image(self):
         """
@@ -127,22 +210,8 @@ class Tetromino(object):
         :return: None
         """
 
-        # Validation: Do not shift the tetromino if it would collide with the playfield or another block
-        if not self.would_collide(-1, 0):
-
-            # Tetromino will be shifted left, therefore decrease x-origin by 1
-            self.x_coord -= 1
-
-            # First remove the square units from the playfield.
-            self.remove_blocks()
-
-            # Loop through each square unit of the tetromino piece
-            for block in self.square_units:
-                # Each block will be shifted to the left by one place
-                block.shift_left()
-
-            # Finally place all blocks back onto the grid.
-            self.add_to_grid()
+        # Shift by -1 in the x-direction, unless it would collide with the playfield or another block.
+        self.move(-1, 0)
 
     def shift_right(self):
         """
@@ -151,22 +220,8 @@ class Tetromino(object):
         :return: None
         """
 
-        # Validation: Do not shift the tetromino if it would collide with the playfield or another block
-        if not self.would_collide(1, 0):
-
-            # Tetromino will be shifted right, therefore increase x-origin by 1
-            self.x_coord += 1
-
-            # First remove the square units from the playfield.
-            self.remove_blocks()
-
-            # Loop through each square unit of the tetromino piece
-            for block in self.square_units:
-                # Each block will be shifted to the right by one place
-                block.shift_right()
-
-            # Finally place all blocks back onto the grid.
-            self.add_to_grid()
+        # Shift by +1 in the x-direction, unless it would collide with the playfield or another block.
+        self.move(1, 0)
 
     def shift_down(self):
         """
@@ -175,19 +230,42 @@ class Tetromino(object):
         :return: None
         """
 
-        # Tetromino will be shifted down, therefore increase y-origin by 1 (down is +ve)
-        self.y_coord += 1
+        # Shift by +1 in the y-direction (down is +ve). The playfield only drops the tetromino once it has checked that
+        # it is not on the ground, so there is no need to check for a collision again.
+        self.move(0, 1, check_collision=False)
 
-        # First remove the square units from the playfield.
-        self.remove_blocks()
+    def move(self, dx, dy, check_collision=True):
+        """
+        Moves the tetromino on the playfield by the given amount, shifting all of its square units as a single group.
+        Unless told not to, it is first checked that the tetromino would not collide with the playfield boundaries or
+        other blocks, and it is not moved if it would.
+        Returns True if the tetromino was moved. Returns False otherwise.
 
-        # Loop through each square unit of the tetromino piece
-        for block in self.square_units:
-            # Each block will be shifted downwards by one place
-            block.shift_down()
+        :param dx: the change in the x position of the tetromino (+ve = right, -ve = left)
+        :param dy: the change in the y position of the tetromino (+ve = down)
+        :param check_collision: whether or not to check that the move would not collide before making it.
+        :type dx: int
+        :type dy: int
+        :type check_collision: bool
+        :return: Boolean value
+        """
+
+        # The positions that each square unit of the tetromino will be moved to.
+        # (worked out once, for both the collision check and the move itself)
+        square_units = self.square_units
+        positions = [(block.x_coord + dx, block.y_coord + dy) for block in square_units]
+
+        # Validation: Do not move the tetromino if it would collide with the playfield or another block
+        if check_collision and not self.grid.check_positions_free(positions, self):
+            return False
 
-        # Finally place all blocks back onto the grid.
-        self.add_to_grid()
+        # Move the origin of the tetromino by the same amount.
+        self.x_coord += dx
+        self.y_coord += dy
+
+        # Move every square unit of the tetromino piece, as a single group.
+        self.grid.move_blocks(square_units, positions)
+        return True
 
     def would_collide(self, dx, dy):
         """
@@ -203,29 +281,11 @@ class Tetromino(object):
         :return: Boolean value
         """
 
-        # grid = GameInterfaceModel.get_playfield() OLD!!!
+        # The positions that each square unit of the tetromino would be moved to.
+        positions = [(block.x_coord + dx, block.y_coord + dy) for block in self.square_units]
 
-        # loop through each square units of the tetromino
-        for block in self.square_units:
-
-            # define the x and y coordinates of where to check for collision
-            x = block.get_x_coord() + dx
-            y = block.get_y_coord() + dy
-
-            # it would collide if the position is outside of the grid boundaries
-            if not self.grid.is_in_bounds(x, y):
-                return True
-
-            # a collision would occur if the position is currently occupied
-            if not self.grid.check_cell_empty(x, y):
-
-                # get the block at the position
-                block_found = self.grid.get_block(x, y)
-
-                # the collision would only count if the block is not from the same tetromino piece
-                if block_found not in self.square_units:
-                    return True
-        return False
+        # It would collide if any of the positions are not free of the playfield boundaries and other blocks.
+        return not self.grid.check_positions_free(positions, self)
 
     def is_on_ground(self):
         """
@@ -257,21 +317,12 @@ class Tetromino(object):
         # Extract the relative positions of the blocks for the current orientation.
         block_vectors = self.block_positions[self.rotation_index]
 
-        # loop through each index of the block_vectors 2D list.
-        for i in range(0, len(block_vectors)):  # 0 - 4 exclusive
-
-            # Get the relative position the block will be set at
-            vector = block_vectors[i]
-
-            # Calculate the actual position to place the block at on the grid
-            x = pos_x + vector[0]
-            y = pos_y + vector[1]
-
-            # Instantiate the block, passing the initial position and colour.
-            block = Block(self.colour, x, y)
+        # Calculate the actual position to place each block at on the grid
+        positions = [(pos_x + vector_x, pos_y + vector_y) for vector_x, vector_y in block_vectors]
 
-            # Add the block to the square_units list at the position of the index
-            self.square_units[i] = block
+        # Instantiate all the blocks together, passing their initial positions and colour, and this tetromino as their
+        # owner. They are kept in the same order as the block vectors.
+        self.square_units = Block.create_group(self.colour, positions, self)
 
     def remove_blocks(self):
         """
@@ -279,14 +330,15 @@ class Tetromino(object):
 
         :return: None
         """
-        # Loop through each square unit of the tetromino
-        for block in self.square_units:
-            # Remove each one from the playfield.
-            self.grid.remove_block(block)
+        # Remove every square unit from the playfield in a single call.
+        self.grid.remove_blocks(self.square_units)
 
     def rotate(self, dr):
         """
-        Used to rotate the tetromino piece at a 90 degree interval
+        Used to rotate the tetromino piece at a 90 degree interval, unless it would collide with the playfield
+        boundaries or other blocks by doing so.
+        The target orientation and block positions are worked out once, for both the collision check and the rotation
+        itself.
 
         :param dr: The direction that the tetromino piece should be rotated.
                     dr =  1 -> Clockwise
@@ -295,109 +347,26 @@ class Tetromino(object):
         :return: None
         """
 
-        # Validation: Do not rotate the tetromino if it would collide with the playfield or another block
-        if not self.can_rotate(dr):
-            return
-
-        # Get the number of possible orientation of the tetromino
-        n = len(self.block_positions)
-
-        # Change the rotation index by the amount given by the parameter
-        self.rotation_index += dr
-
-        """
-        The index is circular - meaning it will cycle from 0 to thr highest index of block_positions
-        """
-        # When it passes the max index,
-        if self.rotation_index == n:
-            # Recycle back to the beginning
-            self.rotation_index = 0
-
-        # When it goes below the minimum index,
-        elif self.rotation_index == -1:
-            # recycle to the end.
-            self.rotation_index = n - 1
-
-        # Get the relative positions that each block should be placed at.
-        block_vectors = self.block_positions[self.rotation_index]
-
-        # First remove the tetromino's blocks from the playfield
-        self.remove_blocks()
-
-        # Loop through each index of the square blocks
-        for i in range(0, len(self.square_units)):
-
-            # Get the block and its position vector from the tetromino origin
-            block = self.square_units[i]
-            vector = block_vectors[i]
-
-            # Calculate the column and row positions the blocks would be placed at.
-            x = self.x_coord + vector[0]
-            y = self.y_coord + vector[1]
-
-            # Set the position of the block
-            block.set_coords(x, y)
-
-            # It will then be added to the playfield.
-            self.grid.add_block(block)
-
-    def can_rotate(self, dr):
-        """
-        Checks whether rotating the tetromino in a given direction will cause it to collide with the playfield
-        boundaries or other blocks already on it.
-        Returns true if there would be a collision.
-        Returns false otherwise.
-
-        :param dr: The direction to rotation - to verify whether or not it is valid.
-
-        :return: Boolean value
-        """
-
-        # Use a temporary variable in place of rotation_index
-        temp_index = self.rotation_index + dr
-
-        # Get the number of possible orientation of the tetromino
-        n = len(self.block_positions)
-
-        """
-        The index is circular - meaning it will cycle from 0 to thr highest index of block_positions
-        """
-        # When it passes the max index,
-        if temp_index == n:
-            # Recycle back to the beginning
-            temp_index = 0
-
-        # When it goes below the minimum index,
-        elif temp_index == -1:
-            # recycle to the end.
-            temp_index = n - 1
+        # Look up the orientation the tetromino would change to (cycling round at either end).
+        rotation_index = self.rotation_table[self.rotation_index][dr]
 
         # Get the relative positions that each block should be placed at.
-        block_vectors = self.block_positions[temp_index]
+        block_vectors = self.block_positions[rotation_index]
 
-        # Iterate over each block position's vector from the tetromino's origin.
-        for vector in block_vectors:
+        # Calculate the column and row positions the blocks will be placed at (looking up the origin only once).
+        x = self.x_coord
+        y = self.y_coord
+        positions = [(x + vector_x, y + vector_y) for vector_x, vector_y in block_vectors]
 
-            # Calculate the column and row positions the blocks would be placed at.
-            x = self.x_coord + vector[0]
-            y = self.y_coord + vector[1]
-
-            # It would collide if the position is outside of the grid boundaries
-            if not self.grid.is_in_bounds(x, y):
-                return False
-
-            # A collision would occur if the position is currently occupied
-            if not self.grid.check_cell_empty(x, y):
+        # Validation: Do not rotate the tetromino if it would collide with the playfield or another block
+        if not self.grid.check_positions_free(positions, self):
+            return
 
-                # Get the block at the position
-                block_found = self.grid.get_block(x, y)
+        # The rotation is valid, so change to the new orientation.
+        self.rotation_index = rotation_index
 
-                # The collision would only count if the block is not from the same tetromino piece
-                if block_found not in self.square_units:
-                    return False
-
-        # At this point, no collisions were found, therefore the tetromino can rotate.
-        return True
+        # Move the tetromino's blocks to their new positions on the playfield together.
+        self.grid.move_blocks(self.square_units, positions)
 
     def rotate_clockwise(self):
         """
@@ -424,23 +393,9 @@ class Tetromino(object):
         :return: A list containing the row indexes (integers) sorted in ascending order
         """
 
-        # Define a new empty list, which will be returned at the end.
-        rows = list()
-
-        # Loop through each block of the tetromino
-        for block in self.square_units:
-
-            # Get the current blocks's row position
-            y = block.get_y_coord()
-
-            # Check if the row index is not already present in the list
-            if y not in rows:
-                # Add it to list if not present
-                rows.append(y)
-
-        # Sort the list in ascending order before returning it.
-        rows.sort()
-        return rows
+        # Collect the row position of each block into a set, so each row is only kept once, then return them sorted
+        # in ascending order as a list.
+        return sorted({block.y_coord for block in self.square_units})
 
     def get_blocks(self):
         """
@@ -457,10 +412,8 @@ class Tetromino(object):
 
         :return: None
         """
-        # Loop through each of the tetromino's block
-        for block in self.square_units:
-            # Have each block added to the playfield
-            self.grid.add_block(block)
+        # Have every block added to the playfield in a single call.
+        self.grid.add_blocks(self.square_units)
 
 
 class ShapeI(Tetromino):
@@ -471,21 +424,16 @@ class ShapeI(Tetromino):
     SURFACE_COLOUR = constants.CYAN
     """a constant tuple for the RGB colour of the tetromino (cyan)"""
 
-    # create a surface object, with a width of 4 units, and a height of 1 unit
-    image = Tetromino.create_surface(width_units=4, height_units=1)
-
-    # completely fill the surface with the RGB colour constant
-    image.fill(SURFACE_COLOUR)
+    # The block positions specific for this class - the second orientation is a quarter turn of the first.
+    block_positions = (((0, 0), (1, 0), (2, 0), (3, 0)),)
+    rotation_pivot = (1.5, 0.5)
+    orientation_count = 2
 
     def __init__(self, playfield):
 
         # call the constructor of the Tetromino class, passing the colour tuple, image and the playfield instance
         super().__init__(ShapeI.SURFACE_COLOUR, ShapeI.image, playfield)
 
-        # Initialise the block positions specific for this class.
-        self.block_positions = [[(0,  0), (1, 0), (2, 0), (3, 0)],
-                                [(2, -1), (2, 0), (2, 1), (2, 2)]]
-
 
 class ShapeJ(Tetromino):
     """
@@ -495,37 +443,16 @@ class ShapeJ(Tetromino):
     SURFACE_COLOUR = constants.BLUE
     """a constant tuple for the RGB colour of the tetromino (blue)"""
 
-    # create a surface object, with a width of 3 units, and a height of 2 unit
-    image = Tetromino.create_surface(width_units=3, height_units=2)
-
-    # get the scale of each grid square unit from the Playfield class
-    scale = Playfield.get_square_size()
-
-    # specify area of top half of surface to fill
-    top_region = pygame.Rect((0, 0), (scale, scale))
-
-    # specify area of bottom half of surface to fill
-    bottom_region = pygame.Rect((0, scale), (scale*3, scale))
-
-    # fill each of these regions
-    image.fill(SURFACE_COLOUR, top_region)
-    image.fill(SURFACE_COLOUR, bottom_region)
-
-    # These variables are not needed anymore, therefore discard them so they do not stay as static variables.
-    del scale
-    del top_region
-    del bottom_region
+    # The block positions specific for this class.
+    block_positions = (((0,  0), (0,  1), (1, 1), (2,  1)),
+                       ((2, -1), (1, -1), (1, 0), (1,  1)),
+                       ((2,  1), (2,  0), (1, 0), (0,  0)),
+                       ((0,  1), (1,  1), (1, 0), (1, -1)))
 
     def __init__(self, playfield):
         # call the constructor of the Tetromino class, passing the colour tuple, image and the playfield instance
         super().__init__(ShapeJ.SURFACE_COLOUR, ShapeJ.image, playfield)
 
-        # Initialise the block positions specific for this class.
-        self.block_positions = [[(0,  0), (0,  1), (1, 1), (2,  1)],
-                                [(2, -1), (1, -1), (1, 0), (1,  1)],
-                                [(2,  1), (2,  0), (1, 0), (0,  0)],
-                                [(0,  1), (1,  1), (1, 0), (1, -1)]]
-
 
 class ShapeL(Tetromino):
     """
@@ -535,37 +462,16 @@ class ShapeL(Tetromino):
     SURFACE_COLOUR = constants.ORANGE
     """a constant tuple for the RGB colour of the tetromino (orange)"""
 
-    # create a surface object, with a width of 3 units, and a height of 2 unit
-    image = Tetromino.create_surface(width_units=3, height_units=2)
-
-    # get the scale of each grid square unit from the Playfield class
-    scale = Playfield.get_square_size()
-
-    # specify area of top half of surface to fill
-    top_region = pygame.Rect((scale*2, 0), (scale, scale))
-
-    # specify area of bottom half of surface to fill
-    bottom_region = pygame.Rect((0, scale), (scale*3, scale))
-
-    # fill each of these regions
-    image.fill(SURFACE_COLOUR, top_region)
-    image.fill(SURFACE_COLOUR, bottom_region)
-
-    # These variables are not needed anymore, therefore discard them so they do not stay as static variables.
-    del scale
-    del top_region
-    del bottom_region
+    # The block positions specific for this class.
+    block_positions = (((0,  1), (1, 1), (2,  1), (2,  0)),
+                       ((1, -1), (1, 0), (1,  1), (2,  1)),
+                       ((2,  0), (1, 0), (0,  0), (0,  1)),
+                       ((1,  1), (1, 0), (1, -1), (0, -1)))
 
     def __init__(self, playfield):
         # call the constructor of the Tetromino class, passing the colour tuple, image and the playfield instance
         super().__init__(ShapeL.SURFACE_COLOUR, ShapeL.image, playfield)
 
-        # Initialise the block positions specific for this class.
-        self.block_positions = [[(0,  1), (1, 1), (2,  1), (2,  0)],
-                                [(1, -1), (1, 0), (1,  1), (2,  1)],
-                                [(2,  0), (1, 0), (0,  0), (0,  1)],
-                                [(1,  1), (1, 0), (1, -1), (0, -1)]]
-
 
 class ShapeO(Tetromino):
     """
@@ -575,19 +481,13 @@ class ShapeO(Tetromino):
     SURFACE_COLOUR = constants.YELLOW
     """a constant tuple for the RGB colour of the tetromino (yellow)"""
 
-    # create a surface object, with a width of 2 units, and a height of 2 units
-    image = Tetromino.create_surface(width_units=2, height_units=2)
-
-    # completely fill the surface with the RGB colour constant
-    image.fill(SURFACE_COLOUR)
+    # The block positions specific for this class.
+    block_positions = (((1, 0), (1, 1), (2, 1), (2, 0)),)
 
     def __init__(self, playfield):
         # call the constructor of the Tetromino class, passing the colour tuple, image and the playfield instance
         super().__init__(ShapeO.SURFACE_COLOUR, ShapeO.image, playfield)
 
-        # Initialise the block positions specific for this class.
-        self.block_positions = [[(1, 0), (1, 1), (2, 1), (2, 0)]]
-
     def rotate(self, dr):
         """
         Tetromino-O does not change position when rotated, therefore have nothing happen the rotate() method is callled
@@ -603,33 +503,14 @@ class ShapeS(Tetromino):
     SURFACE_COLOUR = constants.GREEN
     """a constant tuple for the RGB colour of the tetromino (green)"""
 
-    # create a surface object, with a width of 3 units, and a height of 2 unit
-    image = Tetromino.create_surface(width_units=3, height_units=2)
-
-    # get the scale of each grid square unit from the Playfield class
-    scale = Playfield.get_square_size()
-
-    # specify area of top half of surface to fill
-    top_region = pygame.Rect((scale, 0), (scale*2, scale))
-
-    # specify area of bottom half of surface to fill
-    bottom_region = pygame.Rect((0, scale), (scale*2, scale))
-
-    # fill each of these regions
-    image.fill(SURFACE_COLOUR, top_region)
-    image.fill(SURFACE_COLOUR, bottom_region)
-
-    # These variables are not needed anymore, therefore discard them so they do not stay as static variables.
-    del scale
-    del top_region
-    del bottom_region
+    # The block positions specific for this class - the second orientation is a quarter turn of the first.
+    block_positions = (((0, 1), (1, 1), (1, 0), (2, 0)),)
+    rotation_pivot = (1, 0)
+    orientation_count = 2
 
     def __init__(self, playfield):
         # call the constructor of the Tetromino class, passing the colour tuple, image and the playfield instance
         super().__init__(ShapeS.SURFACE_COLOUR, ShapeS.image, playfield)
-        # Initialise the block positions specific for this class.
-        self.block_positions = [[(0,  1), (1, 1), (1, 0), (2, 0)],
-                                [(0, -1), (0, 0), (1, 0), (1, 1)]]
 
 
 class ShapeT(Tetromino):
@@ -640,37 +521,16 @@ class ShapeT(Tetromino):
     SURFACE_COLOUR = constants.PURPLE
     """a constant tuple for the RGB colour of the tetromino (purple)"""
 
-    # create a surface object, with a width of 3 units, and a height of 2 unit
-    image = Tetromino.create_surface(width_units=3, height_units=2)
-
-    # get the scale of each grid square unit from the Playfield class
-    scale = Playfield.get_square_size()
-
-    # specify area of top half of surface to fill
-    top_region = pygame.Rect((scale, 0), (scale, scale))
-
-    # specify area of bottom half of surface to fill
-    bottom_region = pygame.Rect((0, scale), (scale*3, scale))
-
-    # fill each of these regions
-    image.fill(SURFACE_COLOUR, top_region)
-    image.fill(SURFACE_COLOUR, bottom_region)
-
-    # These variables are not needed anymore, therefore discard them so they do not stay as static variables.
-    del scale
-    del top_region
-    del bottom_region
+    # The block positions specific for this class.
+    block_positions = (((1, 0), (0,  1), (1, 1), (2,  1)),
+                       ((2, 0), (1, -1), (1, 0), (1,  1)),
+                       ((1, 1), (2,  0), (1, 0), (0,  0)),
+                       ((0, 0), (1,  1), (1, 0), (1, -1)))
 
     def __init__(self, playfield):
         # call the constructor of the Tetromino class, passing the colour tuple, image and the playfield instance
         super().__init__(ShapeT.SURFACE_COLOUR, ShapeT.image, playfield)
 
-        # Initialise the block positions specific for this class.
-        self.block_positions = [[(1, 0), (0,  1), (1, 1), (2,  1)],
-                                [(2, 0), (1, -1), (1, 0), (1,  1)],
-                                [(1, 1), (2,  0), (1, 0), (0,  0)],
-                                [(0, 0), (1,  1), (1, 0), (1, -1)]]
-
 
 class ShapeZ(Tetromino):
     """
@@ -680,31 +540,12 @@ class ShapeZ(Tetromino):
     SURFACE_COLOUR = constants.RED
     """a constant tuple for the RGB colour of the tetromino (red)"""
 
-    # create a surface object, with a width of 3 units, and a height of 2 unit
-    image = Tetromino.create_surface(width_units=3, height_units=2)
-
-    # get the scale of each grid square unit from the Playfield class
-    scale = Playfield.get_square_size()
-
-    # specify area of top half of surface to fill
-    top_region = pygame.Rect((0, 0), (scale*2, scale))
-
-    # specify area of bottom half of surface to fill
-    bottom_region = pygame.Rect((scale, scale), (scale*2, scale))
-
-    # fill each of these regions
-    image.fill(SURFACE_COLOUR, top_region)
-    image.fill(SURFACE_COLOUR, bottom_region)
-
-    # These variables are not needed anymore, therefore discard them so they do not stay as static variables.
-    del scale
-    del top_region
-    del bottom_region
+    # The block positions specific for this class - the second orientation is a quarter turn of the first.
+    block_positions = (((0, 0), (1, 0), (1, 1), (2, 1)),)
+    rotation_pivot = (1.5, 0.5)
+    orientation_count = 2
 
     def __init__(self, playfield):
         # call the constructor of the Tetromino class, passing the colour tuple, image and the playfield instance
         super().__init__(ShapeZ.SURFACE_COLOUR, ShapeZ.image, playfield)
 
-        # Initialise the block positions specific for this class.
-        self.block_positions = [[(0,  0), (1, 0), (1, 1), (2, 1)],
-                                [(2, -1), (2, 0), (1, 0), (1, 1)]]